@@ -6,23 +6,29 @@ Run with:  streamlit run app.py
 """
 
 import streamlit as st
+import pandas as pd
+import hashlib
+import itertools
 import logging
 import sys
 import os
+import threading
+import time
 from pathlib import Path
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import AppConfig
-from sync_engine import SyncEngine
 from state_db import SyncStateDB
 from notebooklm_client import NotebookLMClient
-from zotero_client import ZoteroClient
 from utils import setup_logging, get_zotero_storage_path
 
 setup_logging()
 
+# Minimum seconds between progress-bar/status repaints during a sync
+PROGRESS_UI_INTERVAL = 0.25
+
 # ── Page Config ──
 st.set_page_config(
     page_title="CiteBridge",
@@ -32,7 +38,9 @@ st.set_page_config(
 )
 
 # ── Custom CSS ──
-st.markdown("""
+# Accent colours live in .streamlit/config.toml ([theme] primaryColor);
+# only the rules the theme can't express are injected here.
+_CSS = """
 <style>
     .main-header {
         font-size: 2.2rem;
@@ -48,21 +56,191 @@ st.markdown("""
         margin-top: -10px;
         margin-bottom: 20px;
     }
+    .status-row {
+        display: flex;
+        gap: 1rem;
+    }
     .status-card {
+        flex: 1;
         background: #f8f9fa;
         border-radius: 10px;
         padding: 15px 20px;
         margin: 5px 0;
         border-left: 4px solid #667eea;
     }
-    .sync-btn {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    .status-card .label {
+        color: #888;
+        font-size: 0.9rem;
+    }
+    .status-card .value {
+        font-size: 1.6rem;
+        font-weight: 600;
     }
     .stButton > button {
         width: 100%;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_CSS, unsafe_allow_html=True)
+
+
+# ── Cached Resources ──
+
+@st.cache_resource
+def _live_clients() -> dict:
+    """Clients handed out by the factories below, by kind and factory args.
+
+    Clearing a cache_resource doesn't close what it held, so the clients
+    are tracked here and closed by _release_client() first.
+    """
+    return {"zotero": {}, "nlm": {}}
+
+
+def _release_client(kind: str, factory, *args):
+    """Close and evict the cached ``kind`` client built from ``args``.
+
+    Only that one cache entry is dropped; clients cached for other
+    configs may be in use by other browser sessions and are left alone.
+    """
+    client = _live_clients()[kind].pop(args, None)
+    factory.clear(*args)
+    if client is not None:
+        try:
+            client.close()
+        except Exception as e:
+            logging.warning("Error closing %s client: %s", kind, e)
+
+
+@st.cache_resource
+def get_zotero_client(library_id: str, api_key: str, library_type: str,
+                      storage_path: str):
+    """Shared ZoteroClient for a connection config, reused across reruns."""
+    # Deferred: pyzotero is only needed once a Zotero tab/test actually runs
+    from zotero_client import ZoteroClient
+    client = ZoteroClient(library_id, api_key, library_type, storage_path)
+    _live_clients()["zotero"][
+        (library_id, api_key, library_type, storage_path)] = client
+    return client
+
+
+@st.cache_resource
+def get_nlm_client(storage_path: str) -> NotebookLMClient:
+    """Shared NotebookLMClient (keeps its cached auth tokens across reruns)."""
+    client = NotebookLMClient(storage_path or None)
+    _live_clients()["nlm"][(storage_path,)] = client
+    return client
+
+
+@st.cache_resource
+def get_db() -> SyncStateDB:
+    """Shared sync-state DB handle.
+
+    Streamlit may run reruns on different threads, so the handle must be
+    thread-safe (SyncStateDB serializes access to its one connection).
+    """
+    return SyncStateDB()
+
+
+def _config_fingerprint(config: AppConfig) -> tuple:
+    """Connection-relevant config fields; a change means a new engine."""
+    z = config.zotero
+    return (z.library_id, _key_digest(z.api_key), z.library_type,
+            z.local_storage_path, config.notebooklm.storage_path)
+
+
+@st.cache_resource
+def _live_engines() -> dict:
+    """Engines built by get_engine(), by config fingerprint (see _live_clients())."""
+    return {}
+
+
+@st.cache_resource(max_entries=1)
+def get_engine(config_fingerprint: tuple, _config: AppConfig):
+    """Shared SyncEngine for a connection config (clients + DB set up once).
+
+    Shared by every browser session, so runs go through engine.run_session().
+    Only the latest config's engine is kept; the one it replaces is closed
+    in the background, once any run still using it has finished.
+    """
+    from sync_engine import SyncEngine
+    live = _live_engines()
+    while live:
+        _, stale = live.popitem()
+        threading.Thread(target=stale.close, name="engine-close",
+                         daemon=True).start()
+    engine = SyncEngine(_config)
+    live[config_fingerprint] = engine
+    return engine
+
+
+@st.cache_data(ttl=10)
+def _cached_stats(gen: int):
+    """Sync stats; ``gen`` bumps after each sync to force a refresh."""
+    return get_db().get_sync_stats()
+
+
+@st.cache_data(ttl=10)
+def _cached_logs(gen: int, n: int = 20):
+    """Recent sync log entries; keyed on the same sync generation."""
+    return get_db().get_recent_logs(n)
+
+
+@st.cache_data(ttl=3600)
+def _auto_zotero_storage() -> str:
+    """Auto-detected Zotero storage dir (stable for the life of the process)."""
+    return get_zotero_storage_path()
+
+
+@st.cache_data
+def _has_nlm_secret() -> bool:
+    """Whether NOTEBOOKLM_AUTH_JSON is set in Streamlit secrets.
+
+    st.secrets raises when no secrets file exists, so this is checked once.
+    """
+    try:
+        return bool(str(st.secrets.get("NOTEBOOKLM_AUTH_JSON", "")).strip())
+    except Exception:
+        return False
+
+
+@st.cache_data(ttl=60)
+def _has_nlm_env() -> bool:
+    """Whether NOTEBOOKLM_AUTH_JSON is set in the environment."""
+    return bool(os.environ.get("NOTEBOOKLM_AUTH_JSON", "").strip())
+
+
+@st.cache_data(ttl=60)
+def _has_nlm_auth_file() -> bool:
+    """Whether notebooklm-py's default storage_state.json exists."""
+    try:
+        from notebooklm.paths import get_storage_path
+        return get_storage_path().exists()
+    except Exception:
+        return False
+
+
+def _key_digest(api_key: str) -> str:
+    """Short digest of an API key, so the raw secret is never a cache key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+@st.cache_data(ttl=300)
+def _cached_collections(library_id: str, key_digest: str, library_type: str,
+                        storage_path: str, _api_key: str):
+    """Zotero collections sorted by name, refreshed at most every 5 minutes.
+
+    ``_api_key`` is excluded from the cache key (leading underscore);
+    ``key_digest`` stands in for it.
+    """
+    zot = get_zotero_client(library_id, _api_key, library_type, storage_path)
+    return tuple(sorted(zot.get_collections(), key=lambda c: c.name))
+
+
+@st.cache_data(ttl=300)
+def _cached_notebooks(storage_path: str):
+    """NotebookLM notebooks (with source counts) sorted by title, refreshed every 5 minutes."""
+    notebooks = get_nlm_client(storage_path).list_notebooks(include_source_counts=True)
+    return tuple(sorted(notebooks, key=lambda n: n.title))
 
 
 # ── Session State Init ──
@@ -76,6 +254,12 @@ if "zotero_connected" not in st.session_state:
     st.session_state.zotero_connected = False
 if "nlm_connected" not in st.session_state:
     st.session_state.nlm_connected = False
+if "sync_gen" not in st.session_state:
+    st.session_state.sync_gen = 0
+
+# Connection state, computed once per rerun and reused below
+zotero_ok = st.session_state.config.is_zotero_configured()
+nlm_ok = NotebookLMClient.is_authenticated()
 
 
 def add_log(msg: str):
@@ -83,6 +267,17 @@ def add_log(msg: str):
     st.session_state.sync_log.append(msg)
 
 
+def _show_outcome(key: str):
+    """Render (once) a push/import outcome stored before the page rerun."""
+    outcome = st.session_state.pop(key, None)
+    if outcome is None:
+        return
+    kind, text, errors = outcome
+    getattr(st, kind)(text)
+    for err in errors:
+        st.error(err)
+
+
 # ══════════════════════════════════════════
 # SIDEBAR — Settings & Authentication
 # ══════════════════════════════════════════
@@ -91,48 +286,55 @@ with st.sidebar:
     st.markdown("## ⚙️ Settings")
 
     # ── Zotero Settings ──
-    with st.expander("🔶 Zotero Connection", expanded=not st.session_state.config.is_zotero_configured()):
+    with st.expander("🔶 Zotero Connection", expanded=not zotero_ok):
         st.markdown(
             "Get your API key and Library ID from "
             "[zotero.org/settings/keys](https://www.zotero.org/settings/keys)"
         )
-        api_key = st.text_input(
-            "API Key",
-            value=st.session_state.config.zotero.api_key,
-            type="password",
-            key="zotero_api_key",
-        )
-        library_id = st.text_input(
-            "Library ID (your user ID number)",
-            value=st.session_state.config.zotero.library_id,
-            key="zotero_library_id",
-        )
-        library_type = st.selectbox(
-            "Library Type",
-            ["user", "group"],
-            index=0 if st.session_state.config.zotero.library_type == "user" else 1,
-            key="zotero_library_type",
-        )
+        with st.form("zotero_form", border=False):
+            api_key = st.text_input(
+                "API Key",
+                value=st.session_state.config.zotero.api_key,
+                type="password",
+                key="zotero_api_key",
+            )
+            library_id = st.text_input(
+                "Library ID (your user ID number)",
+                value=st.session_state.config.zotero.library_id,
+                key="zotero_library_id",
+            )
+            library_type = st.selectbox(
+                "Library Type",
+                ["user", "group"],
+                index=0 if st.session_state.config.zotero.library_type == "user" else 1,
+                key="zotero_library_type",
+            )
 
-        # Auto-detect Zotero storage
-        auto_storage = get_zotero_storage_path()
-        storage_path = st.text_input(
-            "Local Storage Path (optional, for faster PDF access)",
-            value=st.session_state.config.zotero.local_storage_path or auto_storage,
-            key="zotero_storage_path",
-            help="Path to your Zotero/storage/ directory",
-        )
+            # Auto-detect Zotero storage
+            auto_storage = _auto_zotero_storage()
+            storage_path = st.text_input(
+                "Local Storage Path (optional, for faster PDF access)",
+                value=st.session_state.config.zotero.local_storage_path or auto_storage,
+                key="zotero_storage_path",
+                help="Path to your Zotero/storage/ directory",
+            )
+            zotero_submitted = st.form_submit_button("💾 Save & Test Zotero")
 
-        if st.button("💾 Save & Test Zotero", key="save_zotero"):
+        if zotero_submitted:
+            old = st.session_state.config.zotero
+            old_args = (old.library_id, old.api_key, old.library_type,
+                        old.local_storage_path)
             st.session_state.config.zotero.api_key = api_key
             st.session_state.config.zotero.library_id = library_id
             st.session_state.config.zotero.library_type = library_type
             st.session_state.config.zotero.local_storage_path = storage_path
             st.session_state.config.save()
+            zotero_ok = st.session_state.config.is_zotero_configured()
 
             # Test connection
             try:
-                zot = ZoteroClient(library_id, api_key, library_type, storage_path)
+                _release_client("zotero", get_zotero_client, *old_args)
+                zot = get_zotero_client(library_id, api_key, library_type, storage_path)
                 if zot.test_connection():
                     st.success("✅ Zotero connected!")
                     st.session_state.zotero_connected = True
@@ -144,7 +346,7 @@ with st.sidebar:
                 st.session_state.zotero_connected = False
 
     # ── NotebookLM Settings ──
-    with st.expander("🟣 NotebookLM Connection", expanded=not NotebookLMClient.is_authenticated()):
+    with st.expander("🟣 NotebookLM Connection", expanded=not nlm_ok):
         st.markdown(
             "NotebookLM authentication uses your Google account cookies.\n\n"
             "**Option A — Local usage:** Run `notebooklm login` in your terminal.\n\n"
@@ -154,19 +356,9 @@ with st.sidebar:
         )
 
         # Auth diagnostics
-        _has_env = bool(os.environ.get("NOTEBOOKLM_AUTH_JSON", "").strip())
-        _has_st_secret = False
-        try:
-            _secret = st.secrets.get("NOTEBOOKLM_AUTH_JSON", "")
-            _has_st_secret = bool(_secret and str(_secret).strip())
-        except Exception:
-            pass
-        _has_file = False
-        try:
-            from notebooklm.paths import get_storage_path as _gsp
-            _has_file = _gsp().exists()
-        except Exception:
-            pass
+        _has_env = _has_nlm_env()
+        _has_st_secret = _has_nlm_secret()
+        _has_file = _has_nlm_auth_file()
 
         st.caption(
             f"Auth sources: env var {'✅' if _has_env else '❌'} · "
@@ -174,19 +366,25 @@ with st.sidebar:
             f"local file {'✅' if _has_file else '❌'}"
         )
 
-        nlm_storage = st.text_input(
-            "Auth Storage Path (leave blank for default)",
-            value=st.session_state.config.notebooklm.storage_path,
-            key="nlm_storage_path",
-            help="Default: ~/.notebooklm/storage_state.json",
-        )
+        with st.form("nlm_form", border=False):
+            nlm_storage = st.text_input(
+                "Auth Storage Path (leave blank for default)",
+                value=st.session_state.config.notebooklm.storage_path,
+                key="nlm_storage_path",
+                help="Default: ~/.notebooklm/storage_state.json",
+            )
+            nlm_submitted = st.form_submit_button("🔗 Verify NotebookLM Connection")
 
-        if st.button("🔗 Verify NotebookLM Connection", key="verify_nlm"):
+        if nlm_submitted:
+            old_nlm_storage = st.session_state.config.notebooklm.storage_path
             st.session_state.config.notebooklm.storage_path = nlm_storage
             st.session_state.config.save()
 
+            _has_nlm_env.clear()
+            _has_nlm_auth_file.clear()
             try:
-                nlm = NotebookLMClient(nlm_storage or None)
+                _release_client("nlm", get_nlm_client, old_nlm_storage)
+                nlm = get_nlm_client(nlm_storage)
                 if nlm.test_connection():
                     st.success("✅ NotebookLM connected!")
                     st.session_state.nlm_connected = True
@@ -199,19 +397,21 @@ with st.sidebar:
 
     # ── Sync Settings ──
     with st.expander("🔄 Sync Options"):
-        sync_notes_back = st.checkbox(
-            "Sync NotebookLM notes back to Zotero",
-            value=st.session_state.config.sync.sync_notes_back,
-            key="sync_notes_back",
-        )
-        max_file_size = st.slider(
-            "Max file size (MB)",
-            min_value=10, max_value=500, step=10,
-            value=st.session_state.config.sync.max_file_size_mb,
-            key="max_file_size",
-        )
+        with st.form("sync_form", border=False):
+            sync_notes_back = st.checkbox(
+                "Sync NotebookLM notes back to Zotero",
+                value=st.session_state.config.sync.sync_notes_back,
+                key="sync_notes_back",
+            )
+            max_file_size = st.slider(
+                "Max file size (MB)",
+                min_value=10, max_value=500, step=10,
+                value=st.session_state.config.sync.max_file_size_mb,
+                key="max_file_size",
+            )
+            sync_submitted = st.form_submit_button("💾 Save Sync Settings")
 
-        if st.button("💾 Save Sync Settings", key="save_sync"):
+        if sync_submitted:
             st.session_state.config.sync.sync_notes_back = sync_notes_back
             st.session_state.config.sync.max_file_size_mb = max_file_size
             st.session_state.config.save()
@@ -229,264 +429,360 @@ st.markdown(
 )
 
 # ── Connection Status ──
-col1, col2, col3 = st.columns(3)
-with col1:
-    zotero_ok = st.session_state.config.is_zotero_configured()
-    st.metric("Zotero", "✅ Connected" if zotero_ok else "❌ Not configured")
-with col2:
-    nlm_ok = NotebookLMClient.is_authenticated()
-    st.metric("NotebookLM", "✅ Connected" if nlm_ok else "❌ Not authenticated")
-with col3:
-    db = SyncStateDB()
-    stats = db.get_sync_stats()
-    st.metric("Items Synced", stats["items_synced"])
+# Rendered as one markdown block rather than three st.metric widgets
+stats = _cached_stats(st.session_state.sync_gen)
+_status_cards = [
+    ("Zotero", "✅ Connected" if zotero_ok else "❌ Not configured"),
+    ("NotebookLM", "✅ Connected" if nlm_ok else "❌ Not authenticated"),
+    ("Items Synced", stats["items_synced"]),
+]
+st.markdown(
+    '<div class="status-row">'
+    + "".join(
+        f'<div class="status-card"><div class="label">{label}</div>'
+        f'<div class="value">{value}</div></div>'
+        for label, value in _status_cards
+    )
+    + "</div>",
+    unsafe_allow_html=True,
+)
 
 st.divider()
 
-# ── Main Tabs ──
-if not zotero_ok:
-    st.warning(
-        "👈 Configure your Zotero API key in the sidebar to get started."
-    )
-elif not nlm_ok:
-    st.warning(
-        "👈 Authenticate with NotebookLM (run `notebooklm login` in terminal) "
-        "then verify the connection in the sidebar."
-    )
-else:
-    tab_push, tab_import, tab_history = st.tabs([
-        "📤 Push to NotebookLM",
-        "📥 Import Sources to Zotero",
-        "📋 Sync History",
-    ])
 
-    # ══════════════════════════════════════
-    # TAB 1: Zotero → NotebookLM
-    # ══════════════════════════════════════
-    with tab_push:
-        try:
-            zot = ZoteroClient(
-                st.session_state.config.zotero.library_id,
-                st.session_state.config.zotero.api_key,
-                st.session_state.config.zotero.library_type,
-                st.session_state.config.zotero.local_storage_path,
+# ══════════════════════════════════════════
+# TAB 1: Zotero → NotebookLM
+# ══════════════════════════════════════════
+
+@st.fragment
+def render_push_tab():
+    """Collection picker and push button (reruns independently of the page)."""
+    zcfg = st.session_state.config.zotero
+    df_key = f"coll_df_{zcfg.library_id}"
+
+    if st.button("🔄 Refresh collections", key="refresh_collections"):
+        get_zotero_client(zcfg.library_id, zcfg.api_key, zcfg.library_type,
+                          zcfg.local_storage_path).invalidate_collections_cache()
+        _cached_collections.clear()
+        st.session_state.pop(df_key, None)
+
+    try:
+        collections = _cached_collections(
+            zcfg.library_id,
+            _key_digest(zcfg.api_key),
+            zcfg.library_type,
+            zcfg.local_storage_path,
+            zcfg.api_key,
+        )
+
+        if not collections:
+            st.info("No collections found in your Zotero library.")
+        else:
+            st.markdown("### 📚 Select Zotero Collections to Push")
+            st.markdown(
+                "Each selected collection becomes a NotebookLM notebook "
+                "with all PDFs added as sources."
             )
-            collections = zot.get_collections()
 
-            if not collections:
-                st.info("No collections found in your Zotero library.")
-            else:
-                st.markdown("### 📚 Select Zotero Collections to Push")
-                st.markdown(
-                    "Each selected collection becomes a NotebookLM notebook "
-                    "with all PDFs added as sources."
-                )
+            previously_selected = frozenset(
+                st.session_state.config.sync.enabled_collections
+            )
 
-                previously_selected = set(
-                    st.session_state.config.sync.enabled_collections
+            # One data_editor widget instead of a checkbox per collection.
+            # The frame is kept in session state and only rebuilt when the
+            # collections or the saved selection change.
+            signature = (collections, previously_selected)
+            cached_df = st.session_state.get(df_key)
+            if cached_df is not None and cached_df[0] == signature:
+                coll_df = cached_df[1]
+            else:
+                coll_df = pd.DataFrame([
+                    {
+                        "selected": coll.key in previously_selected,
+                        "name": coll.name,
+                        "items": coll.num_items,
+                        "key": coll.key,
+                    }
+                    for coll in collections
+                ])
+                st.session_state[df_key] = (signature, coll_df)
+
+            edited = st.data_editor(
+                coll_df,
+                hide_index=True,
+                use_container_width=True,
+                disabled=["name", "items", "key"],
+                column_config={
+                    "selected": st.column_config.CheckboxColumn("Push"),
+                    "name": st.column_config.TextColumn("📁 Collection"),
+                    "items": st.column_config.NumberColumn("Items"),
+                    "key": None,
+                },
+                key="collections_editor",
+            )
+            selected_keys = edited.loc[edited["selected"], "key"].tolist()
+
+            st.divider()
+
+            col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
+            with col_btn2:
+                sync_clicked = st.button(
+                    "📤 **PUSH TO NOTEBOOKLM**",
+                    type="primary",
+                    use_container_width=True,
+                    disabled=len(selected_keys) == 0,
+                    key="sync_now",
                 )
 
-                selected_keys = []
-                cols = st.columns(2)
-                for i, coll in enumerate(sorted(collections, key=lambda c: c.name)):
-                    with cols[i % 2]:
-                        checked = st.checkbox(
-                            f"📁 **{coll.name}** ({coll.num_items} items)",
-                            value=coll.key in previously_selected,
-                            key=f"coll_{coll.key}",
-                        )
-                        if checked:
-                            selected_keys.append(coll.key)
-
-                st.divider()
-
-                col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
-                with col_btn2:
-                    sync_clicked = st.button(
-                        "📤 **PUSH TO NOTEBOOKLM**",
-                        type="primary",
-                        use_container_width=True,
-                        disabled=len(selected_keys) == 0,
-                        key="sync_now",
-                    )
-
-                if len(selected_keys) == 0:
-                    st.caption("Select at least one collection to push.")
-
-                if sync_clicked and selected_keys:
-                    st.session_state.config.sync.enabled_collections = selected_keys
-                    st.session_state.config.save()
-                    st.session_state.sync_log = []
-
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    step_count = [0]
-                    total_steps = len(selected_keys) * 3
-
-                    def progress_callback_push(msg):
-                        step_count[0] += 1
-                        progress = min(step_count[0] / max(total_steps, 1), 0.99)
-                        progress_bar.progress(progress)
-                        status_text.markdown(f"**{msg}**")
-                        st.session_state.sync_log.append(msg)
-
-                    try:
-                        engine = SyncEngine(
-                            st.session_state.config,
-                            progress_callback=progress_callback_push,
-                        )
+            if len(selected_keys) == 0:
+                st.caption("Select at least one collection to push.")
+            _show_outcome("push_outcome")
+
+            if sync_clicked and selected_keys:
+                st.session_state.config.sync.enabled_collections = selected_keys
+                st.session_state.config.save()
+                st.session_state.sync_log = []
+
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                step_counter = itertools.count(1)
+                inv_total = 1.0 / max(len(selected_keys) * 3, 1)
+                last_ui = [0.0]
+
+                def progress_callback_push(msg):
+                    step = next(step_counter)
+                    st.session_state.sync_log.append(msg)
+                    # Throttle repaints; the full log is kept regardless
+                    now = time.monotonic()
+                    if now - last_ui[0] < PROGRESS_UI_INTERVAL:
+                        return
+                    last_ui[0] = now
+                    progress = min(step * inv_total, 0.99)
+                    progress_bar.progress(progress)
+                    status_text.markdown(f"**{msg}**")
+
+                try:
+                    config = st.session_state.config
+                    engine = get_engine(_config_fingerprint(config), config)
+                    # The engine is shared across sessions; runs take turns
+                    with engine.run_session(config, progress_callback_push):
                         result = engine.sync_all(selected_keys)
-                        progress_bar.progress(1.0)
-                        status_text.empty()
-
-                        if result.success:
-                            st.success(f"✅ Push complete!\n\n{result.summary()}")
-                        else:
-                            st.warning(
-                                f"⚠️ Push completed with errors:\n\n{result.summary()}"
-                            )
-                            for err in result.errors:
-                                st.error(err)
-                    except Exception as e:
-                        st.error(f"❌ Push failed: {e}")
-                        logging.exception("Push failed")
+                    progress_bar.progress(1.0)
+                    status_text.empty()
+
+                    if result.success:
+                        outcome = ("success",
+                                   f"✅ Push complete!\n\n{result.summary()}", [])
+                    else:
+                        outcome = (
+                            "warning",
+                            f"⚠️ Push completed with errors:\n\n{result.summary()}",
+                            result.errors,
+                        )
+                except Exception as e:
+                    outcome = ("error", f"❌ Push failed: {e}", [])
+                    logging.exception("Push failed")
 
-        except Exception as e:
-            st.error(f"❌ Failed to load Zotero collections: {e}")
-            st.info("Check your Zotero API key and Library ID in the sidebar.")
+                # Full rerun so the status cards, history and log outside
+                # this fragment pick up the run; the outcome is shown after
+                st.session_state.push_outcome = outcome
+                st.session_state.sync_gen += 1
+                st.rerun()
 
-    # ══════════════════════════════════════
-    # TAB 2: NotebookLM → Zotero (SOURCES)
-    # ══════════════════════════════════════
-    with tab_import:
-        st.markdown("### 📥 Import NotebookLM Sources into Zotero")
-        st.markdown(
-            "Select notebooks below to pull their **raw sources** "
-            "(PDFs, web pages, videos, etc.) into your Zotero library. "
-            "Each notebook becomes a Zotero collection with proper "
-            "library items, URLs, and full extracted text."
+    except Exception as e:
+        st.error(f"❌ Failed to load Zotero collections: {e}")
+        st.info("Check your Zotero API key and Library ID in the sidebar.")
+
+
+# ══════════════════════════════════════════
+# TAB 2: NotebookLM → Zotero (SOURCES)
+# ══════════════════════════════════════════
+
+@st.fragment
+def render_import_tab():
+    """Notebook picker and import button (reruns independently of the page)."""
+    st.markdown("### 📥 Import NotebookLM Sources into Zotero")
+    st.markdown(
+        "Select notebooks below to pull their **raw sources** "
+        "(PDFs, web pages, videos, etc.) into your Zotero library. "
+        "Each notebook becomes a Zotero collection with proper "
+        "library items, URLs, and full extracted text."
+    )
+
+    if st.button("🔄 Refresh notebooks", key="refresh_notebooks"):
+        _cached_notebooks.clear()
+
+    try:
+        notebooks = _cached_notebooks(
+            st.session_state.config.notebooklm.storage_path
         )
 
-        try:
-            nlm = NotebookLMClient(
-                st.session_state.config.notebooklm.storage_path or None,
+        if not notebooks:
+            st.info("No notebooks found in NotebookLM.")
+        else:
+            nb_df = pd.DataFrame([
+                {
+                    "selected": False,
+                    "title": nb.title,
+                    "sources": nb.sources_count,
+                    "id": nb.id,
+                }
+                for nb in notebooks
+            ])
+            edited = st.data_editor(
+                nb_df,
+                hide_index=True,
+                use_container_width=True,
+                disabled=["title", "sources", "id"],
+                column_config={
+                    "selected": st.column_config.CheckboxColumn("Import"),
+                    "title": st.column_config.TextColumn("📓 Notebook"),
+                    "sources": st.column_config.NumberColumn("Sources"),
+                    "id": None,
+                },
+                key="notebooks_editor",
+            )
+            selected_notebooks = edited.loc[edited["selected"], "id"].tolist()
+
+            st.divider()
+
+            include_fulltext = st.checkbox(
+                "Include full extracted text (slower but much more valuable)",
+                value=True,
+                key="include_fulltext",
+                help="Fetches the complete text NotebookLM extracted from "
+                     "each source and saves it as a Zotero note. "
+                     "This is the main value — you get the full content "
+                     "even if the original source goes offline.",
             )
-            notebooks = nlm.list_notebooks(include_source_counts=True)
 
-            if not notebooks:
-                st.info("No notebooks found in NotebookLM.")
-            else:
-                selected_notebooks = []
-                cols = st.columns(2)
-
-                for i, nb in enumerate(sorted(notebooks, key=lambda n: n.title)):
-                    with cols[i % 2]:
-                        checked = st.checkbox(
-                            f"📓 **{nb.title}** ({nb.sources_count} sources)",
-                            key=f"nb_{nb.id}",
-                        )
-                        if checked:
-                            selected_notebooks.append(nb.id)
-
-                st.divider()
-
-                include_fulltext = st.checkbox(
-                    "Include full extracted text (slower but much more valuable)",
-                    value=True,
-                    key="include_fulltext",
-                    help="Fetches the complete text NotebookLM extracted from "
-                         "each source and saves it as a Zotero note. "
-                         "This is the main value — you get the full content "
-                         "even if the original source goes offline.",
+            col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
+            with col_btn2:
+                import_clicked = st.button(
+                    "📥 **IMPORT SOURCES TO ZOTERO**",
+                    type="primary",
+                    use_container_width=True,
+                    disabled=len(selected_notebooks) == 0,
+                    key="import_now",
                 )
 
-                col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
-                with col_btn2:
-                    import_clicked = st.button(
-                        "📥 **IMPORT SOURCES TO ZOTERO**",
-                        type="primary",
-                        use_container_width=True,
-                        disabled=len(selected_notebooks) == 0,
-                        key="import_now",
-                    )
-
-                if len(selected_notebooks) == 0:
-                    st.caption("Select at least one notebook to import.")
-
-                if import_clicked and selected_notebooks:
-                    st.session_state.sync_log = []
-
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    step_count = [0]
-                    total_steps = len(selected_notebooks) * 5
-
-                    def progress_callback_import(msg):
-                        step_count[0] += 1
-                        progress = min(step_count[0] / max(total_steps, 1), 0.99)
-                        progress_bar.progress(progress)
-                        status_text.markdown(f"**{msg}**")
-                        st.session_state.sync_log.append(msg)
-
-                    try:
-                        engine = SyncEngine(
-                            st.session_state.config,
-                            progress_callback=progress_callback_import,
-                        )
+            if len(selected_notebooks) == 0:
+                st.caption("Select at least one notebook to import.")
+            _show_outcome("import_outcome")
+
+            if import_clicked and selected_notebooks:
+                st.session_state.sync_log = []
+
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                step_counter = itertools.count(1)
+                inv_total = 1.0 / max(len(selected_notebooks) * 5, 1)
+                last_ui = [0.0]
+
+                def progress_callback_import(msg):
+                    step = next(step_counter)
+                    st.session_state.sync_log.append(msg)
+                    # Throttle repaints; the full log is kept regardless
+                    now = time.monotonic()
+                    if now - last_ui[0] < PROGRESS_UI_INTERVAL:
+                        return
+                    last_ui[0] = now
+                    progress = min(step * inv_total, 0.99)
+                    progress_bar.progress(progress)
+                    status_text.markdown(f"**{msg}**")
+
+                try:
+                    config = st.session_state.config
+                    engine = get_engine(_config_fingerprint(config), config)
+                    with engine.run_session(config, progress_callback_import):
                         result = engine.import_all_notebooks(
                             selected_notebooks,
                             include_fulltext=include_fulltext,
                         )
-                        progress_bar.progress(1.0)
-                        status_text.empty()
-
-                        if result.success:
-                            st.success(
-                                f"✅ Import complete!\n\n{result.summary()}\n\n"
-                                f"Open Zotero to see your new collections "
-                                f"(prefixed with 'NLM:')."
-                            )
-                        else:
-                            st.warning(
-                                f"⚠️ Import completed with errors:\n\n"
-                                f"{result.summary()}"
-                            )
-                            for err in result.errors:
-                                st.error(err)
-                    except Exception as e:
-                        st.error(f"❌ Import failed: {e}")
-                        logging.exception("Import failed")
+                    progress_bar.progress(1.0)
+                    status_text.empty()
+
+                    if result.success:
+                        outcome = (
+                            "success",
+                            f"✅ Import complete!\n\n{result.summary()}\n\n"
+                            f"Open Zotero to see your new collections "
+                            f"(prefixed with 'NLM:').",
+                            [],
+                        )
+                    else:
+                        outcome = (
+                            "warning",
+                            f"⚠️ Import completed with errors:\n\n"
+                            f"{result.summary()}",
+                            result.errors,
+                        )
+                except Exception as e:
+                    outcome = ("error", f"❌ Import failed: {e}", [])
+                    logging.exception("Import failed")
+
+                st.session_state.import_outcome = outcome
+                st.session_state.sync_gen += 1
+                st.rerun()
+
+    except Exception as e:
+        st.error(f"❌ Failed to load NotebookLM notebooks: {e}")
+        st.info(
+            "Make sure you've authenticated with NotebookLM. "
+            "Run `notebooklm login` in your terminal."
+        )
 
-        except Exception as e:
-            st.error(f"❌ Failed to load NotebookLM notebooks: {e}")
-            st.info(
-                "Make sure you've authenticated with NotebookLM. "
-                "Run `notebooklm login` in your terminal."
+
+# ══════════════════════════════════════════
+# TAB 3: History
+# ══════════════════════════════════════════
+
+@st.fragment
+def render_history_tab():
+    """Recent entries from the sync log."""
+    st.markdown("### 📋 Sync History")
+
+    logs = _cached_logs(st.session_state.sync_gen, 20)
+
+    if logs:
+        for entry in logs:
+            icon = (
+                "✅" if entry.status == "success"
+                else "⚠️" if entry.status == "partial"
+                else "❌"
+            )
+            st.markdown(
+                f"**{icon} {entry.action}** — {entry.timestamp}\n\n"
+                f"<small>{entry.details}</small>",
+                unsafe_allow_html=True,
             )
+    else:
+        st.caption("No sync history yet. Run your first sync above!")
 
-    # ══════════════════════════════════════
-    # TAB 3: History
-    # ══════════════════════════════════════
-    with tab_history:
-        st.markdown("### 📋 Sync History")
 
-        db = SyncStateDB()
-        logs = db.get_recent_logs(20)
+# ── Main Tabs ──
+if not zotero_ok:
+    st.warning(
+        "👈 Configure your Zotero API key in the sidebar to get started."
+    )
+elif not nlm_ok:
+    st.warning(
+        "👈 Authenticate with NotebookLM (run `notebooklm login` in terminal) "
+        "then verify the connection in the sidebar."
+    )
+else:
+    tab_push, tab_import, tab_history = st.tabs([
+        "📤 Push to NotebookLM",
+        "📥 Import Sources to Zotero",
+        "📋 Sync History",
+    ])
 
-        if logs:
-            for entry in logs:
-                icon = (
-                    "✅" if entry.status == "success"
-                    else "⚠️" if entry.status == "partial"
-                    else "❌"
-                )
-                st.markdown(
-                    f"**{icon} {entry.action}** — {entry.timestamp}\n\n"
-                    f"<small>{entry.details}</small>",
-                    unsafe_allow_html=True,
-                )
-        else:
-            st.caption("No sync history yet. Run your first sync above!")
+    with tab_push:
+        render_push_tab()
+    with tab_import:
+        render_import_tab()
+    with tab_history:
+        render_history_tab()
 
 
 # ── Live Log (from current session) ──
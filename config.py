@@ -4,20 +4,55 @@ Handles loading/saving settings and credentials.
 """
 
 import os
+import copy
+import functools
 import yaml
 import logging
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    from notebooklm.auth import get_storage_path
+except ImportError:  # notebooklm-py not installed; only needed for the auth check
+    get_storage_path = None
+
 # Default config directory
 CONFIG_DIR = Path.home() / ".citebridge"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 DB_FILE = CONFIG_DIR / "sync_state.db"
 
 
+# NotebookLM auth files seen to exist (cleared on save); misses aren't
+# cached, so a later `notebooklm login` is picked up on the next check
+_AUTH_FOUND = set()
+
+
+def _auth_exists(path: str) -> bool:
+    """Existence check for a NotebookLM auth file, memoizing only hits."""
+    if path in _AUTH_FOUND:
+        return True
+    if Path(path).exists():
+        _AUTH_FOUND.add(path)
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=4)
+def _load_raw(mtime_ns: int) -> dict:
+    """Parse the config file; keyed on its mtime so edits invalidate the cache."""
+    with open(CONFIG_FILE, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 @dataclass
 class ZoteroConfig:
     api_key: str = ""
@@ -38,6 +73,7 @@ class SyncConfig:
     auto_sync_interval_minutes: int = 0  # 0 = disabled
     sync_notes_back: bool = True  # Reverse sync NLM notes → Zotero
     max_file_size_mb: int = 200  # Skip files larger than this
+    upload_concurrency: int = 4  # Items downloaded/uploaded in parallel
 
 
 @dataclass
@@ -46,12 +82,35 @@ class AppConfig:
     notebooklm: NotebookLMConfig = field(default_factory=NotebookLMConfig)
     sync: SyncConfig = field(default_factory=SyncConfig)
 
+    # Hash of the last saved/loaded contents (plain attribute, not a field)
+    _last_saved_hash = None
+
+    def _as_dict(self) -> dict:
+        """Shallow dict view for serialization (cheaper than asdict's deep copy).
+
+        The nested configs hold only scalars and a list of strings.
+        """
+        return {
+            "zotero": vars(self.zotero),
+            "notebooklm": vars(self.notebooklm),
+            "sync": {**vars(self.sync)},
+        }
+
     def save(self):
-        """Save config to disk."""
+        """Save config to disk (no-op if nothing changed since last save/load)."""
+        data = self._as_dict()
+        h = hash(repr(data))
+        if h == self._last_saved_hash:
+            logger.debug("Config unchanged, skipping save")
+            return
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        data = asdict(self)
-        with open(CONFIG_FILE, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+        # Write to a temp file and swap it in, so a crash never truncates config
+        tmp = CONFIG_FILE.with_suffix(".yaml.tmp")
+        with open(tmp, "w") as f:
+            yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False)
+        os.replace(tmp, CONFIG_FILE)
+        self._last_saved_hash = h
+        _AUTH_FOUND.clear()
         logger.info(f"Config saved to {CONFIG_FILE}")
 
     @classmethod
@@ -61,13 +120,14 @@ class AppConfig:
             logger.info("No config file found, using defaults")
             return cls()
         try:
-            with open(CONFIG_FILE, "r") as f:
-                data = yaml.safe_load(f) or {}
+            # Deep-copy so callers can't mutate the cached parse
+            data = copy.deepcopy(_load_raw(CONFIG_FILE.stat().st_mtime_ns))
             config = cls(
                 zotero=ZoteroConfig(**data.get("zotero", {})),
                 notebooklm=NotebookLMConfig(**data.get("notebooklm", {})),
                 sync=SyncConfig(**data.get("sync", {})),
             )
+            config._last_saved_hash = hash(repr(config._as_dict()))
             logger.info(f"Config loaded from {CONFIG_FILE}")
             return config
         except Exception as e:
@@ -79,6 +139,8 @@ class AppConfig:
 
     def is_notebooklm_configured(self) -> bool:
         """Check if NotebookLM auth tokens exist on disk."""
-        from notebooklm.auth import get_storage_path
-        storage = Path(self.notebooklm.storage_path) if self.notebooklm.storage_path else get_storage_path()
-        return storage.exists()
+        if self.notebooklm.storage_path:
+            return _auth_exists(self.notebooklm.storage_path)
+        if get_storage_path is None:
+            return False
+        return _auth_exists(str(get_storage_path()))
@@ -5,27 +5,124 @@ adding sources, and reading notes.
 Uses the unofficial notebooklm-py library (async API).
 All public methods in this wrapper are synchronous for easy integration.
 
-Key design: Each API call creates a fresh async client within a proper
-async context manager, ensuring the httpx session is always opened and
-closed within the same event loop.  Auth tokens are fetched once and
-cached for reuse across calls.
+Key design: All async work runs on one process-wide asyncio event loop
+in a background thread.  Each wrapper opens a single async client on that
+loop on first use and reuses it for every call, so the httpx connection
+pool (and its TLS sessions) survives between operations.  Auth tokens are
+fetched once and cached for reuse across calls.
 """
 
+from __future__ import annotations
+
 import asyncio
+import atexit
 import logging
 import os
-import subprocess
+import pickle
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Any, Tuple
+from dataclasses import dataclass, field, replace
 
 logger = logging.getLogger(__name__)
 
+# Process-wide auth memo: only a positive result is cached, so a login done
+# outside the app (e.g. `notebooklm login` in a terminal) is still noticed.
+_AUTH_PRESENT = False
+_SECRET_LOADED = False
+
+# Seconds a list_notebooks() response is reused before re-fetching.
+# The cache is process-wide, so every client for the same account (the
+# GUI's and the sync engine's) shares it:
+# (storage_path, include_source_counts) → (fetched_at, notebooks, {title: nb})
+_NOTEBOOKS_TTL = 15.0
+_NOTEBOOKS_CACHE: Dict[Tuple[Optional[str], bool], tuple] = {}
+
+# On-disk AuthTokens cache, reused across processes while the source
+# storage file is unchanged and the cached tokens are younger than max age
+AUTH_CACHE_FILE = Path.home() / ".cache" / "zoterolm" / "auth.bin"
+_AUTH_CACHE_MAX_AGE = 3600.0
+
+
+def _s(x) -> str:
+    """str() an SDK enum/value and intern it (kinds and statuses repeat a lot)."""
+    return sys.intern(str(x)) if x is not None else ""
+
+
+def invalidate_auth_cache():
+    """Forget the cached is_authenticated() result and any cached tokens."""
+    global _AUTH_PRESENT
+    _AUTH_PRESENT = False
+    _drop_auth_file_cache()
+
+
+def _auth_source_mtime(storage_path: Optional[str]) -> Optional[int]:
+    """mtime_ns of the auth storage file, or None if tokens don't come from a file."""
+    if os.environ.get("NOTEBOOKLM_AUTH_JSON", "").strip():
+        return None
+    try:
+        if storage_path:
+            path = Path(storage_path)
+        else:
+            from notebooklm.paths import get_storage_path
+            path = get_storage_path()
+        return path.stat().st_mtime_ns
+    except Exception:
+        return None
+
+
+def _load_auth_file_cache(source_mtime: int):
+    """Return cached AuthTokens if still valid for ``source_mtime``, else None."""
+    try:
+        with open(AUTH_CACHE_FILE, "rb") as f:
+            cached_mtime, saved_at, auth = pickle.load(f)
+    except Exception:
+        return None
+    if cached_mtime != source_mtime:
+        return None
+    if time.time() - saved_at > _AUTH_CACHE_MAX_AGE:
+        return None
+    return auth
+
+
+def _save_auth_file_cache(source_mtime: int, auth):
+    """Write AuthTokens to the cache file (owner-only, atomic replace)."""
+    try:
+        AUTH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp: unique per writer, created 0600
+        fd, tmp = tempfile.mkstemp(dir=AUTH_CACHE_FILE.parent,
+                                   prefix=AUTH_CACHE_FILE.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((source_mtime, time.time(), auth), f)
+            os.replace(tmp, AUTH_CACHE_FILE)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except Exception as e:
+        logger.debug(f"Could not write auth cache: {e}")
+
+
+def _drop_auth_file_cache():
+    try:
+        AUTH_CACHE_FILE.unlink()
+    except OSError:
+        pass
+
 
 # ── Data Classes (stable interface for rest of app) ──
 
-@dataclass
+# slots=True needs Python 3.10+; older interpreters get plain frozen classes
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class NLMNotebook:
     """Represents a NotebookLM notebook."""
     id: str
@@ -34,7 +131,7 @@ class NLMNotebook:
     created_at: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class NLMSource:
     """Represents a source in a NotebookLM notebook."""
     id: str
@@ -43,9 +140,14 @@ class NLMSource:
     status: str = ""
     is_ready: bool = False
     url: Optional[str] = None
+    # title.lower().strip(), for duplicate checks (derived, not an init arg)
+    norm_title: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "norm_title", self.title.lower().strip())
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class NLMSourceFull:
     """A source with its full extracted text content."""
     id: str
@@ -54,9 +156,14 @@ class NLMSourceFull:
     url: Optional[str] = None
     content: str = ""
     char_count: int = 0
+    # title.lower().strip(), for duplicate checks (derived, not an init arg)
+    norm_title: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        object.__setattr__(self, "norm_title", self.title.lower().strip())
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class NLMNote:
     """Represents a note in a NotebookLM notebook."""
     id: str
@@ -66,27 +173,101 @@ class NLMNote:
 
 # ── Async-to-Sync Bridge ──
 
-def _run_async(coro):
-    """Run an async coroutine synchronously.
+class _LoopThread:
+    """Process-wide asyncio event loop running in a daemon thread.
 
-    Handles the case where we're inside an existing event loop
-    (e.g., Streamlit) by running in a separate thread with its
-    own event loop.
+    Started on first use; every coroutine the sync wrapper needs is
+    submitted here, so no event loop or worker thread is created per call.
     """
+
+    _lock = threading.Lock()
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def loop(cls) -> asyncio.AbstractEventLoop:
+        loop = cls._loop
+        if loop is not None:
+            return loop
+        with cls._lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                cls._thread = threading.Thread(
+                    target=cls._loop.run_forever,
+                    name="notebooklm-loop",
+                    daemon=True,
+                )
+                cls._thread.start()
+                atexit.register(cls.stop)
+            return cls._loop
+
+    @classmethod
+    def stop(cls):
+        """Stop the loop and join its thread (registered with atexit)."""
+        with cls._lock:
+            loop, thread = cls._loop, cls._thread
+            cls._loop = cls._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """True for network/timeout/5xx/429 errors worth retrying."""
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    try:
+        import httpx
+    except ImportError:
+        return False
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code == 429 or code >= 500
+    return False
+
+
+def _is_auth_error(exc: BaseException) -> bool:
+    """True for errors that suggest expired cookies or a stale CSRF token."""
+    if any("auth" in cls.__name__.lower() or "csrf" in cls.__name__.lower()
+           for cls in type(exc).__mro__):
+        return True
     try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
+        import httpx
+    except ImportError:
+        return False
+    return (isinstance(exc, httpx.HTTPStatusError)
+            and exc.response.status_code in (401, 403))
+
+
+def _auth_signature(auth) -> tuple:
+    """The parts of AuthTokens that a refresh changes (see _remember_auth)."""
+    return (getattr(auth, "csrf_token", None), getattr(auth, "session_id", None))
 
-    if loop and loop.is_running():
-        # We're inside an existing event loop (e.g., Streamlit).
-        # Run in a thread with a fresh event loop.
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            future = pool.submit(asyncio.run, coro)
-            return future.result()
-    else:
-        return asyncio.run(coro)
+
+async def _with_retry(coro_fn, attempts: int = 3, base: float = 0.5):
+    """Await ``coro_fn()``, retrying transient errors with exponential backoff.
+
+    Runs entirely on the loop thread, so retries reuse the open client.
+    """
+    for i in range(attempts):
+        try:
+            return await coro_fn()
+        except Exception as e:
+            if i == attempts - 1 or not _is_transient(e):
+                raise
+            delay = base * 2 ** i
+            logger.warning(f"Transient NotebookLM error ({e}); retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def _run_async(coro):
+    """Run an async coroutine synchronously on the shared loop thread."""
+    return asyncio.run_coroutine_threadsafe(coro, _LoopThread.loop()).result()
 
 
 # ── Main Client ──
@@ -96,9 +277,10 @@ class NotebookLMClient:
     High-level synchronous client for NotebookLM.
     Wraps the async notebooklm-py library (v0.3.x).
 
-    Each API call creates a fresh async client connection within a
-    proper async context manager.  This avoids event-loop and session
-    lifecycle issues that arise when mixing sync/async code.
+    All async work runs on the shared background event loop, so the
+    async client can be opened once and kept alive across calls (the
+    httpx session is always used from the loop that opened it).
+    Call close() — or use the client as a context manager — to release it.
 
     Auth tokens (cookies + CSRF + session ID) are fetched once from
     storage and reused across calls.
@@ -113,6 +295,33 @@ class NotebookLMClient:
         """
         self._storage_path = storage_path
         self._auth = None   # Cached AuthTokens (fetched once)
+        self._auth_sig = None  # _auth_signature() of the tokens last cached
+        self._client = None  # Entered notebooklm-py client (opened lazily)
+        self._client_lock = threading.Lock()
+        # id(client) → calls in flight on it (see _lease_client)
+        self._leases: Dict[int, int] = {}
+        # Clients replaced after an auth error, closed by their last caller
+        self._retired: Dict[int, Any] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the async client (the shared event loop keeps running)."""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            self._close_client(client)
+
+    @staticmethod
+    def _close_client(client):
+        try:
+            _run_async(client.__aexit__(None, None, None))
+        except Exception as e:
+            logger.warning(f"Error closing NotebookLM client: {e}")
 
     # ── Internal Helpers ──
 
@@ -123,7 +332,13 @@ class NotebookLMClient:
         Streamlit Cloud stores secrets in st.secrets, which doesn't
         always automatically appear in os.environ.  This bridge
         ensures notebooklm-py's AuthTokens.from_storage() can find it.
+        Runs at most once per process.
         """
+        global _SECRET_LOADED
+        if _SECRET_LOADED:
+            return
+        _SECRET_LOADED = True
+
         if os.environ.get("NOTEBOOKLM_AUTH_JSON", "").strip():
             return  # Already set
 
@@ -137,13 +352,26 @@ class NotebookLMClient:
             pass  # Not running in Streamlit or no secret set
 
     def _ensure_auth(self):
-        """Fetch auth tokens from storage (done once, then cached)."""
+        """Fetch auth tokens from storage (done once, then cached).
+
+        Tokens loaded from a storage file are also cached on disk
+        (AUTH_CACHE_FILE), so a restarted process can skip from_storage().
+        """
         if self._auth is not None:
             return
 
         # Bridge Streamlit secrets → env var before auth lookup
         self._load_streamlit_secret()
 
+        source_mtime = _auth_source_mtime(self._storage_path)
+        if source_mtime is not None:
+            cached = _load_auth_file_cache(source_mtime)
+            if cached is not None:
+                self._auth = cached
+                self._auth_sig = _auth_signature(cached)
+                logger.info("NotebookLM authentication tokens loaded from cache")
+                return
+
         async def _fetch_auth():
             from notebooklm.auth import AuthTokens
             path = Path(self._storage_path) if self._storage_path else None
@@ -154,30 +382,155 @@ class NotebookLMClient:
             logger.info("NotebookLM authentication tokens loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load NotebookLM auth: {e}")
+            _drop_auth_file_cache()
             raise
 
-    def _call(self, async_fn):
-        """Execute an async operation with a properly managed client.
+        if source_mtime is not None:
+            _save_auth_file_cache(source_mtime, self._auth)
+        self._auth_sig = _auth_signature(self._auth)
+
+    def _remember_auth(self, auth):
+        """Adopt tokens the client refreshed, writing them to the file cache."""
+        self._auth = auth
+        sig = _auth_signature(auth)
+        if sig == self._auth_sig:
+            return
+        self._auth_sig = sig
+        source_mtime = _auth_source_mtime(self._storage_path)
+        if source_mtime is not None:
+            _save_auth_file_cache(source_mtime, auth)
+
+    def _reset_auth(self, client):
+        """Forget tokens (memory and disk) and retire ``client``, opened with them.
+
+        Other threads may still have calls in flight on ``client``, so it
+        is only detached here; the last of them closes it (_release_client).
+        If another thread already replaced it, nothing is reset again.
+        """
+        with self._client_lock:
+            if self._client is not client:
+                return
+            self._client = None
+            self._auth = None
+            self._auth_sig = None
+            _drop_auth_file_cache()
+            if id(client) in self._leases:
+                self._retired[id(client)] = client
+                return
+        self._close_client(client)
+
+    def _lease_client(self):
+        """Return the shared async client (opened on first use), marked in use.
+
+        Every lease must be returned with _release_client().
+        """
+        with self._client_lock:
+            client = self._client
+            if client is None:
+                client = self._open_client()
+            self._leases[id(client)] = self._leases.get(id(client), 0) + 1
+            return client
+
+    def _release_client(self, client):
+        """End a lease; closes ``client`` if it was retired and this was its last call."""
+        with self._client_lock:
+            remaining = self._leases.pop(id(client)) - 1
+            if remaining:
+                self._leases[id(client)] = remaining
+                return
+            retired = self._retired.pop(id(client), None)
+        if retired is not None:
+            self._close_client(retired)
+
+    def _open_client(self):
+        """Fetch tokens if needed and open the async client (_client_lock held)."""
+        self._ensure_auth()
 
-        Creates a fresh NotebookLMClient (from notebooklm-py) for each
-        call, opening and closing the httpx session within the same
-        event loop.
+        async def _open():
+            from notebooklm.client import NotebookLMClient as _AsyncClient
+            client = _AsyncClient(self._auth)
+            await client.__aenter__()
+            return client
+
+        try:
+            self._client = _run_async(_open())
+        except Exception:
+            # Cached tokens may be stale — refetch from storage next time
+            self._auth = None
+            self._auth_sig = None
+            _drop_auth_file_cache()
+            raise
+        return self._client
+
+    def _call(self, async_fn):
+        """Execute an async operation against the shared client.
 
         Args:
             async_fn: An async callable that takes the opened client
                       and returns a result.
         """
-        self._ensure_auth()
+        for attempt in range(2):
+            client = self._lease_client()
+            try:
+                result = _run_async(async_fn(client))
+            except Exception as e:
+                # Stale tokens: reload them from storage and try once more
+                if attempt or not _is_auth_error(e):
+                    raise
+                logger.warning(f"NotebookLM auth failed ({e}); reloading tokens")
+                self._reset_auth(client)
+                continue
+            finally:
+                self._release_client(client)
+            # Capture any refreshed tokens
+            self._remember_auth(client.auth)
+            return result
+
+    def _call_many(self, async_fns, concurrency: int = 8) -> List[Any]:
+        """Execute several async operations concurrently on the shared client.
+
+        At most ``concurrency`` operations are in flight at once, and each
+        retries transient errors on its own (see _with_retry).  Results
+        come back in input order; a failed operation yields its exception
+        object instead of raising.
+        """
+        async def _execute(client, fns):
+            semaphore = asyncio.Semaphore(concurrency)
 
-        async def _execute():
-            from notebooklm.client import NotebookLMClient as _AsyncClient
-            async with _AsyncClient(self._auth) as client:
-                result = await async_fn(client)
-                # Capture any refreshed tokens
-                self._auth = client.auth
-                return result
+            async def _bounded(fn):
+                async with semaphore:
+                    return await _with_retry(lambda: fn(client))
+
+            return await asyncio.gather(
+                *(_bounded(fn) for fn in fns),
+                return_exceptions=True,
+            )
 
-        return _run_async(_execute())
+        async_fns = list(async_fns)
+        client = self._lease_client()
+        try:
+            results = _run_async(_execute(client, async_fns))
+        finally:
+            self._release_client(client)
+
+        # Operations that failed on stale tokens are retried once with
+        # tokens reloaded from storage
+        stale = [i for i, r in enumerate(results)
+                 if isinstance(r, Exception) and _is_auth_error(r)]
+        if stale:
+            logger.warning("NotebookLM auth failed; reloading tokens")
+            self._reset_auth(client)
+            client = self._lease_client()
+            try:
+                retried = _run_async(
+                    _execute(client, [async_fns[i] for i in stale]))
+            finally:
+                self._release_client(client)
+            for i, r in zip(stale, retried):
+                results[i] = r
+
+        self._remember_auth(client.auth)
+        return results
 
     # ── Connection & Auth ──
 
@@ -199,6 +552,9 @@ class NotebookLMClient:
         Launch the interactive login flow.
         This opens a browser for Google OAuth authentication.
         """
+        import subprocess
+
+        invalidate_auth_cache()
         try:
             cli_path = "notebooklm"
             for p in [
@@ -222,7 +578,18 @@ class NotebookLMClient:
 
     @staticmethod
     def is_authenticated() -> bool:
-        """Check if NotebookLM auth tokens exist (file, env var, or Streamlit secret)."""
+        """Check if NotebookLM auth tokens exist (file, env var, or Streamlit secret).
+
+        A positive answer is cached for the life of the process.
+        """
+        global _AUTH_PRESENT
+        if _AUTH_PRESENT:
+            return True
+        _AUTH_PRESENT = NotebookLMClient._check_auth_sources()
+        return _AUTH_PRESENT
+
+    @staticmethod
+    def _check_auth_sources() -> bool:
         try:
             # Check env var (for CI / direct deployment)
             auth_json = os.environ.get("NOTEBOOKLM_AUTH_JSON", "").strip()
@@ -251,12 +618,36 @@ class NotebookLMClient:
     def list_notebooks(self, include_source_counts: bool = False) -> List[NLMNotebook]:
         """List all notebooks in the account.
 
+        Responses are reused for _NOTEBOOKS_TTL seconds by every client
+        with the same storage path; create_notebook() invalidates them.
+
         Args:
             include_source_counts: If True, fetches the actual source count
                 for each notebook (slower but accurate).  The NotebookLM API
                 does not include source counts in notebook metadata, so this
                 requires one extra API call per notebook.
         """
+        return list(self._get_notebooks_cached(include_source_counts)[1])
+
+    def _get_notebooks_cached(self, include_source_counts: bool = False
+                              ) -> Tuple[float, List[NLMNotebook], Dict[str, NLMNotebook]]:
+        """Return the cache entry for list_notebooks(), refreshing if stale."""
+        now = time.monotonic()
+        # A listing with source counts also answers a plain listing
+        for counts in ((True,) if include_source_counts else (False, True)):
+            cached = _NOTEBOOKS_CACHE.get((self._storage_path, counts))
+            if cached and now - cached[0] < _NOTEBOOKS_TTL:
+                return cached
+
+        notebooks = self._fetch_notebooks(include_source_counts)
+        # reversed() so the first notebook wins on duplicate titles
+        by_title = {nb.title: nb for nb in reversed(notebooks)}
+        entry = (time.monotonic(), notebooks, by_title)
+        _NOTEBOOKS_CACHE[(self._storage_path, include_source_counts)] = entry
+        return entry
+
+    def _fetch_notebooks(self, include_source_counts: bool) -> List[NLMNotebook]:
+        """Fetch the notebook list from NotebookLM (uncached)."""
         if include_source_counts:
             # Single client session for all calls (much faster)
             async def _op_with_counts(client):
@@ -302,17 +693,15 @@ class NotebookLMClient:
             return await client.notebooks.create(title)
 
         nb = self._call(_op)
+        for counts in (False, True):
+            _NOTEBOOKS_CACHE.pop((self._storage_path, counts), None)
         result = NLMNotebook(id=nb.id, title=nb.title)
         logger.info(f"Created notebook: {result.title} ({result.id})")
         return result
 
     def find_notebook_by_title(self, title: str) -> Optional[NLMNotebook]:
         """Find a notebook by exact title match."""
-        notebooks = self.list_notebooks()
-        for nb in notebooks:
-            if nb.title == title:
-                return nb
-        return None
+        return self._get_notebooks_cached()[2].get(title)
 
     def find_or_create_notebook(self, title: str) -> NLMNotebook:
         """Find existing notebook by title, or create a new one."""
@@ -346,9 +735,9 @@ class NotebookLMClient:
         src = self._call(_op)
         result = NLMSource(
             id=src.id,
-            title=src.title or Path(file_path).stem,
-            source_type=str(src.kind),
-            status=str(src.status),
+            title=src.title if src.title else Path(file_path).stem,
+            source_type=_s(src.kind),
+            status=_s(src.status),
             is_ready=src.is_ready,
         )
         logger.info(f"Added source: {result.title} → notebook {notebook_id}")
@@ -366,7 +755,7 @@ class NotebookLMClient:
         return NLMSource(
             id=src.id,
             title=src.title or url,
-            source_type=str(src.kind),
+            source_type=_s(src.kind),
             is_ready=src.is_ready,
         )
 
@@ -380,8 +769,8 @@ class NotebookLMClient:
             NLMSource(
                 id=s.id,
                 title=s.title or "Untitled",
-                source_type=str(s.kind),
-                status=str(s.status),
+                source_type=_s(s.kind),
+                status=_s(s.status),
                 is_ready=s.is_ready,
                 url=s.url,
             )
@@ -398,11 +787,15 @@ class NotebookLMClient:
         async def _op(client):
             return await client.sources.get_fulltext(notebook_id, source_id)
 
-        ft = self._call(_op)
+        return self._to_source_full(self._call(_op))
+
+    @staticmethod
+    def _to_source_full(ft) -> NLMSourceFull:
+        """Convert a notebooklm-py fulltext result to NLMSourceFull."""
         return NLMSourceFull(
             id=ft.source_id,
             title=ft.title,
-            source_type=str(ft.kind),
+            source_type=_s(ft.kind),
             url=ft.url,
             content=ft.content,
             char_count=ft.char_count,
@@ -424,27 +817,38 @@ class NotebookLMClient:
         collection into Zotero.
         """
         sources = self.list_sources(notebook_id)
+
+        def _fulltext_op(source_id: str):
+            async def _op(client):
+                return await client.sources.get_fulltext(notebook_id, source_id)
+            return _op
+
+        # Fetch all fulltexts concurrently over the one client session
+        fulltexts = self._call_many([_fulltext_op(src.id) for src in sources])
         results = []
 
-        for src in sources:
-            try:
-                full = self.get_source_fulltext(notebook_id, src.id)
-                # Merge the URL from list_sources if fulltext didn't have it
-                if not full.url and src.url:
-                    full.url = src.url
-                if not full.source_type and src.source_type:
-                    full.source_type = src.source_type
-                results.append(full)
-                logger.info(
-                    f"Got fulltext for: {full.title} ({full.char_count} chars)"
-                )
-            except Exception as e:
-                logger.error(f"Failed to get fulltext for {src.title}: {e}")
+        for src, ft in zip(sources, fulltexts):
+            if isinstance(ft, BaseException):
+                logger.error(f"Failed to get fulltext for {src.title}: {ft}")
                 # Still include with basic info
                 results.append(NLMSourceFull(
                     id=src.id, title=src.title,
                     source_type=src.source_type, url=src.url,
                 ))
+                continue
+
+            full = self._to_source_full(ft)
+            # Merge the URL from list_sources if fulltext didn't have it
+            if (not full.url and src.url) or (not full.source_type and src.source_type):
+                full = replace(
+                    full,
+                    url=full.url or src.url,
+                    source_type=full.source_type or src.source_type,
+                )
+            results.append(full)
+            logger.info(
+                f"Got fulltext for: {full.title} ({full.char_count} chars)"
+            )
 
         return results
 
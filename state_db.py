@@ -4,17 +4,83 @@ Tracks what has been synced between Zotero and NotebookLM
 to avoid duplicates and detect changes.
 """
 
+import atexit
 import sqlite3
+import sys
 import logging
+import queue
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# ── SQL statements ──
+# Kept as module constants so every call passes the identical string and
+# hits sqlite3's per-connection statement cache.
+
+_SQL_UPSERT_COLLECTION = """
+    INSERT INTO synced_collections (zotero_key, zotero_name, nlm_notebook_id, last_synced)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(zotero_key) DO UPDATE SET
+        zotero_name = excluded.zotero_name,
+        nlm_notebook_id = COALESCE(NULLIF(excluded.nlm_notebook_id, ''), nlm_notebook_id),
+        last_synced = excluded.last_synced
+"""
+
+_SQL_UPSERT_ITEM = """
+    INSERT INTO synced_items
+        (zotero_key, collection_zotero_key, title, file_hash, nlm_source_id,
+         file_size, file_mtime_ns, last_synced)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(zotero_key, collection_zotero_key) DO UPDATE SET
+        title = excluded.title,
+        file_hash = COALESCE(NULLIF(excluded.file_hash, ''), file_hash),
+        nlm_source_id = COALESCE(NULLIF(excluded.nlm_source_id, ''), nlm_source_id),
+        file_size = COALESCE(excluded.file_size, file_size),
+        file_mtime_ns = COALESCE(excluded.file_mtime_ns, file_mtime_ns),
+        last_synced = excluded.last_synced
+"""
+
+_SQL_RECORD_NOTE = """
+    INSERT OR REPLACE INTO nlm_notes_synced
+        (nlm_notebook_id, nlm_note_id, zotero_item_key, zotero_note_key, synced_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_LOG = "INSERT INTO sync_log (action, status, details) VALUES (?, ?, ?)"
+
+# Background log writer: flush after this many entries or seconds
+_LOG_BATCH_SIZE = 256
+_LOG_BATCH_SECONDS = 0.1
+_LOG_STOP = object()
+
+_SQL_SYNCED_ITEMS = """
+    SELECT id, zotero_key, collection_zotero_key, title,
+           file_hash, nlm_source_id, last_synced
+    FROM synced_items WHERE collection_zotero_key = ?
+"""
 
-@dataclass
+# All summary counters in one statement (see SyncStateDB.get_sync_stats)
+_SQL_SYNC_STATS = """
+    SELECT
+        (SELECT COUNT(*) FROM synced_collections),
+        (SELECT COUNT(*) FROM synced_items),
+        (SELECT COUNT(*) FROM nlm_notes_synced),
+        (SELECT MAX(last_synced) FROM synced_items)
+"""
+
+
+# slots=True needs Python 3.10+; older interpreters get plain frozen classes
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SyncedCollection:
     id: int
     zotero_key: str
@@ -23,7 +89,7 @@ class SyncedCollection:
     last_synced: str
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SyncedItem:
     id: int
     zotero_key: str
@@ -34,7 +100,7 @@ class SyncedItem:
     last_synced: str
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SyncLogEntry:
     timestamp: str
     action: str
@@ -42,8 +108,19 @@ class SyncLogEntry:
     details: str
 
 
+def _flush_logs_at_exit(db_ref):
+    db = db_ref()
+    if db is not None:
+        db.flush_logs()
+
+
 class SyncStateDB:
-    """Manages sync state in a local SQLite database."""
+    """Manages sync state in a local SQLite database.
+
+    Holds one connection for the lifetime of the instance.  The connection
+    is shared across threads (Streamlit reruns, worker pools), so every
+    statement runs under ``self._lock``.
+    """
 
     def __init__(self, db_path: Optional[str] = None):
         if db_path is None:
@@ -52,12 +129,73 @@ class SyncStateDB:
 
         self.db_path = db_path
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Autocommit mode: each statement commits on its own
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.RLock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")
         self._init_db()
 
+        # log() is fire-and-forget: entries are queued and written in
+        # batches by a background thread
+        self._log_queue = queue.SimpleQueue()
+        self._log_thread = threading.Thread(
+            target=self._log_writer, name="sync-log-writer", daemon=True
+        )
+        self._log_thread.start()
+        # The writer is a daemon thread; don't lose queued rows at exit
+        atexit.register(_flush_logs_at_exit, weakref.ref(self))
+
+    def close(self):
+        """Flush pending log entries and close the underlying connection."""
+        if self._log_thread.is_alive():
+            self._log_queue.put(_LOG_STOP)
+            self._log_thread.join()
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @contextmanager
+    def batch(self):
+        """Group writes into a single transaction (one commit/fsync).
+
+        Usage:
+            with db.batch():
+                for ...: db.upsert_item(...)
+
+        Commits on success and rolls back if the block raises.  Nested
+        batches join the outer transaction.  Other threads' DB calls wait
+        until the batch finishes.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # Conventional name for the same context manager
+    transaction = batch
+
     def _init_db(self):
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript("""
+        with self._lock:
+            self._conn.executescript("""
                 CREATE TABLE IF NOT EXISTS synced_collections (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     zotero_key TEXT UNIQUE NOT NULL,
@@ -74,6 +212,8 @@ class SyncStateDB:
                     file_hash TEXT,
                     nlm_source_id TEXT,
                     last_synced TIMESTAMP,
+                    file_size INTEGER,
+                    file_mtime_ns INTEGER,
                     UNIQUE(zotero_key, collection_zotero_key)
                 );
 
@@ -94,7 +234,32 @@ class SyncStateDB:
                     status TEXT NOT NULL,
                     details TEXT
                 );
+
+                -- The UNIQUE(zotero_key, collection_zotero_key) index leads
+                -- with zotero_key, so per-collection lookups need their own.
+                -- (sync_log.id is the rowid and nlm_note_id is UNIQUE, so
+                -- those lookups are already indexed.)
+                CREATE INDEX IF NOT EXISTS idx_items_collection
+                    ON synced_items(collection_zotero_key);
+                CREATE INDEX IF NOT EXISTS idx_items_last_synced
+                    ON synced_items(last_synced);
             """)
+            # Databases created before the file fingerprint columns existed
+            columns = {
+                row[1] for row in
+                self._conn.execute("PRAGMA table_info(synced_items)")
+            }
+            for column in ("file_size", "file_mtime_ns"):
+                if column not in columns:
+                    self._conn.execute(
+                        f"ALTER TABLE synced_items ADD COLUMN {column} INTEGER"
+                    )
+            # Gather planner statistics once per database file
+            has_stats = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            if not has_stats:
+                self._conn.execute("ANALYZE")
         logger.info(f"Sync state DB initialized at {self.db_path}")
 
     # ── Collection tracking ──
@@ -103,20 +268,13 @@ class SyncStateDB:
                           nlm_notebook_id: str = ""):
         """Insert or update a synced collection."""
         now = datetime.utcnow().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO synced_collections (zotero_key, zotero_name, nlm_notebook_id, last_synced)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(zotero_key) DO UPDATE SET
-                    zotero_name = excluded.zotero_name,
-                    nlm_notebook_id = COALESCE(NULLIF(excluded.nlm_notebook_id, ''), nlm_notebook_id),
-                    last_synced = excluded.last_synced
-            """, (zotero_key, zotero_name, nlm_notebook_id, now))
+        with self._lock:
+            self._conn.execute(_SQL_UPSERT_COLLECTION, (zotero_key, zotero_name, nlm_notebook_id, now))
 
     def get_collection(self, zotero_key: str) -> Optional[SyncedCollection]:
         """Get a synced collection by Zotero key."""
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT id, zotero_key, zotero_name, nlm_notebook_id, last_synced "
                 "FROM synced_collections WHERE zotero_key = ?",
                 (zotero_key,)
@@ -132,11 +290,26 @@ class SyncStateDB:
 
     # ── Item tracking ──
 
+    def load_sync_map(self, collection_key: str) -> Dict[str, str]:
+        """Get {zotero_key: file_hash} for every synced item in a collection.
+
+        One query per collection, so per-item checks become dict lookups.
+        """
+        with self._lock:
+            return {key: fhash or "" for key, fhash in self._conn.execute(
+                "SELECT zotero_key, file_hash FROM synced_items "
+                "WHERE collection_zotero_key = ?",
+                (collection_key,)
+            )}
+
     def is_item_synced(self, zotero_key: str, collection_key: str,
                        file_hash: str = "") -> bool:
-        """Check if an item has already been synced (and hasn't changed)."""
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
+        """Check if an item has already been synced (and hasn't changed).
+
+        For checking many items, prefer load_sync_map().
+        """
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT file_hash FROM synced_items "
                 "WHERE zotero_key = ? AND collection_zotero_key = ?",
                 (zotero_key, collection_key)
@@ -148,40 +321,72 @@ class SyncStateDB:
                 return False
             return True
 
+    def get_item_fingerprint(self, zotero_key: str
+                             ) -> Optional[Tuple[int, int, str]]:
+        """Get (file_size, file_mtime_ns, file_hash) recorded for an item.
+
+        Looks across all collections, since the same attachment file can be
+        synced from several.  Returns None if no hashed file is on record.
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT file_size, file_mtime_ns, file_hash FROM synced_items "
+                "WHERE zotero_key = ? AND file_size IS NOT NULL "
+                "AND file_mtime_ns IS NOT NULL AND file_hash != '' "
+                "ORDER BY last_synced DESC LIMIT 1",
+                (zotero_key,)
+            ).fetchone()
+
     def upsert_item(self, zotero_key: str, collection_key: str,
                     title: str, file_hash: str = "",
-                    nlm_source_id: str = ""):
+                    nlm_source_id: str = "",
+                    file_size: Optional[int] = None,
+                    file_mtime_ns: Optional[int] = None):
         """Insert or update a synced item."""
         now = datetime.utcnow().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO synced_items
-                    (zotero_key, collection_zotero_key, title, file_hash, nlm_source_id, last_synced)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(zotero_key, collection_zotero_key) DO UPDATE SET
-                    title = excluded.title,
-                    file_hash = COALESCE(NULLIF(excluded.file_hash, ''), file_hash),
-                    nlm_source_id = COALESCE(NULLIF(excluded.nlm_source_id, ''), nlm_source_id),
-                    last_synced = excluded.last_synced
-            """, (zotero_key, collection_key, title, file_hash, nlm_source_id, now))
+        with self._lock:
+            self._conn.execute(_SQL_UPSERT_ITEM, (
+                zotero_key, collection_key, title, file_hash, nlm_source_id,
+                file_size, file_mtime_ns, now,
+            ))
+
+    def upsert_items_many(self, rows: Iterable[tuple]):
+        """Insert or update many synced items in one transaction.
+
+        Args:
+            rows: (zotero_key, collection_key, title, file_hash, nlm_source_id,
+                  file_size, file_mtime_ns) tuples, same semantics as
+                  upsert_item().
+        """
+        now = datetime.utcnow().isoformat()
+        with self.batch():
+            self._conn.executemany(
+                _SQL_UPSERT_ITEM, (tuple(r) + (now,) for r in rows)
+            )
 
     def get_synced_items_for_collection(self, collection_key: str) -> List[SyncedItem]:
         """Get all synced items for a collection."""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
-                "SELECT id, zotero_key, collection_zotero_key, title, "
-                "file_hash, nlm_source_id, last_synced "
-                "FROM synced_items WHERE collection_zotero_key = ?",
-                (collection_key,)
-            ).fetchall()
-            return [SyncedItem(*r) for r in rows]
+        with self._lock:
+            return [SyncedItem(*r) for r in self._conn.execute(
+                _SQL_SYNCED_ITEMS, (collection_key,)
+            )]
+
+    def iter_synced_items(self, collection_key: str) -> Iterator[SyncedItem]:
+        """Stream synced items for a collection without building a list.
+
+        The connection lock is held until the generator is exhausted or
+        closed, so consume it promptly.
+        """
+        with self._lock:
+            for r in self._conn.execute(_SQL_SYNCED_ITEMS, (collection_key,)):
+                yield SyncedItem(*r)
 
     # ── NLM note tracking (reverse sync) ──
 
     def is_nlm_note_synced(self, nlm_note_id: str) -> bool:
         """Check if a NotebookLM note has been synced to Zotero."""
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT 1 FROM nlm_notes_synced WHERE nlm_note_id = ?",
                 (nlm_note_id,)
             ).fetchone()
@@ -192,48 +397,72 @@ class SyncStateDB:
                               zotero_note_key: str = ""):
         """Record that a NotebookLM note has been synced to Zotero."""
         now = datetime.utcnow().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO nlm_notes_synced
-                    (nlm_notebook_id, nlm_note_id, zotero_item_key, zotero_note_key, synced_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (nlm_notebook_id, nlm_note_id, zotero_item_key, zotero_note_key, now))
+        with self._lock:
+            self._conn.execute(_SQL_RECORD_NOTE, (nlm_notebook_id, nlm_note_id, zotero_item_key, zotero_note_key, now))
 
     # ── Sync log ──
 
     def log(self, action: str, status: str, details: str = ""):
-        """Add an entry to the sync log."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "INSERT INTO sync_log (action, status, details) VALUES (?, ?, ?)",
-                (action, status, details)
-            )
+        """Add an entry to the sync log (written asynchronously)."""
+        self._log_queue.put_nowait((action, status, details))
+
+    def flush_logs(self, timeout: float = 5.0):
+        """Block until every log entry queued so far has been written."""
+        if not self._log_thread.is_alive():
+            return
+        done = threading.Event()
+        self._log_queue.put(done)
+        done.wait(timeout)
+
+    def _log_writer(self):
+        """Drain the log queue, writing up to _LOG_BATCH_SIZE rows at a time."""
+        while True:
+            entry = self._log_queue.get()
+            pending, waiters, stop = [], [], False
+            deadline = time.monotonic() + _LOG_BATCH_SECONDS
+            while True:
+                if entry is _LOG_STOP:
+                    stop = True
+                    break
+                if isinstance(entry, threading.Event):
+                    waiters.append(entry)
+                    break
+                pending.append(entry)
+                remaining = deadline - time.monotonic()
+                if len(pending) >= _LOG_BATCH_SIZE or remaining <= 0:
+                    break
+                try:
+                    entry = self._log_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if pending:
+                try:
+                    with self.batch():
+                        self._conn.executemany(_SQL_LOG, pending)
+                except Exception as e:
+                    logger.error(f"Failed to write sync log entries: {e}")
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
 
     def get_recent_logs(self, limit: int = 50) -> List[SyncLogEntry]:
         """Get recent sync log entries."""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        self.flush_logs()
+        with self._lock:
+            return [SyncLogEntry(*r) for r in self._conn.execute(
                 "SELECT timestamp, action, status, details "
                 "FROM sync_log ORDER BY id DESC LIMIT ?",
                 (limit,)
-            ).fetchall()
-            return [SyncLogEntry(*r) for r in rows]
+            )]
 
     def get_sync_stats(self) -> Dict[str, Any]:
         """Get summary statistics about sync state."""
-        with sqlite3.connect(self.db_path) as conn:
-            collections = conn.execute(
-                "SELECT COUNT(*) FROM synced_collections"
-            ).fetchone()[0]
-            items = conn.execute(
-                "SELECT COUNT(*) FROM synced_items"
-            ).fetchone()[0]
-            notes = conn.execute(
-                "SELECT COUNT(*) FROM nlm_notes_synced"
-            ).fetchone()[0]
-            last_sync = conn.execute(
-                "SELECT MAX(last_synced) FROM synced_items"
-            ).fetchone()[0]
+        with self._lock:
+            collections, items, notes, last_sync = self._conn.execute(
+                _SQL_SYNC_STATS
+            ).fetchone()
 
         return {
             "collections_synced": collections,
@@ -3,20 +3,44 @@ Core sync engine — orchestrates bidirectional sync between Zotero and Notebook
 """
 
 import logging
+import os
+import queue
+import shutil
 import tempfile
+import threading
+import time
+from contextlib import closing, contextmanager
+from concurrent.futures import (
+    FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait,
+)
 from pathlib import Path
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Set, Tuple
 from dataclasses import dataclass, field
 
 from zotero_client import ZoteroClient, ZoteroCollection, ZoteroItem
-from notebooklm_client import NotebookLMClient, NLMNotebook, NLMSourceFull
+from notebooklm_client import NotebookLMClient, NLMNotebook, NLMSource, NLMSourceFull
 from state_db import SyncStateDB
-from utils import file_hash, file_size_mb
+from utils import file_hash
 from config import AppConfig
 
 logger = logging.getLogger(__name__)
 
 
+# Default progress callback; compared by identity in SyncEngine._emit_lazy()
+def _NOP(msg: str):
+    pass
+
+
+# Seconds a notebook's source list is reused across sync operations
+_SOURCES_TTL = 30.0
+
+# Synced-item state rows written per upsert_items_many() call
+_UPSERT_BATCH = 10
+
+# Seconds between checks for newly started uploads in the worker pool
+_PROGRESS_POLL = 0.25
+
+
 @dataclass
 class SyncResult:
     """Result of a single sync operation."""
@@ -53,6 +77,32 @@ class FullSyncResult:
         return "\n".join(lines)
 
 
+@dataclass
+class _ItemOutcome:
+    """What happened to one item during a forward sync."""
+    status: str  # "synced", "skipped" or "error"
+    row: Optional[tuple] = None  # upsert_items_many() row
+    source: Optional[NLMSource] = None  # newly uploaded source
+    messages: List[tuple] = field(default_factory=list)  # (fmt, *args)
+    error: str = ""
+
+
+class _ZoteroThrottle:
+    """Caps concurrent Zotero calls made by the engine's worker threads.
+
+    Rate limiting (429 / Retry-After) is handled per request inside
+    ZoteroClient._api(); the engine never re-runs a wrapped call, since
+    compound calls such as import_sources_as_items() are not idempotent.
+    """
+
+    def __init__(self, permits: int):
+        self._permits = threading.Semaphore(max(1, permits))
+
+    def call(self, fn: Callable, *args, **kwargs):
+        with self._permits:
+            return fn(*args, **kwargs)
+
+
 class SyncEngine:
     """
     Orchestrates the sync between Zotero and NotebookLM.
@@ -70,7 +120,7 @@ class SyncEngine:
             progress_callback: Optional function called with status messages
         """
         self.config = config
-        self._progress = progress_callback or (lambda msg: None)
+        self._progress = progress_callback or _NOP
 
         # Initialize clients
         self.zotero = ZoteroClient(
@@ -83,19 +133,97 @@ class SyncEngine:
             storage_path=config.notebooklm.storage_path or None,
         )
         self.db = SyncStateDB()
+        self._zotero_throttle = _ZoteroThrottle(
+            config.sync.upload_concurrency or 4
+        )
+
+        # notebook_id → (fetched_at, sources), see _get_sources_cached()
+        self._sources_cache: Dict[str, Tuple[float, List[NLMSource]]] = {}
+        # Held for a whole run by run_session()
+        self._run_lock = threading.Lock()
+
+    @property
+    def progress_callback(self) -> Callable[[str], None]:
+        return self._progress
+
+    @progress_callback.setter
+    def progress_callback(self, callback: Optional[Callable[[str], None]]):
+        """Swap the progress callback (lets a long-lived engine be reused)."""
+        self._progress = callback or _NOP
+
+    @contextmanager
+    def run_session(self, config: Optional[AppConfig] = None,
+                    progress_callback: Optional[Callable[[str], None]] = None):
+        """Use the engine exclusively for one run.
+
+        A long-lived engine may be shared by several callers (e.g. GUI
+        sessions); this serializes their runs and scopes the config and
+        progress callback to the run, restoring the previous ones after.
+        """
+        with self._run_lock:
+            previous = (self.config, self._progress)
+            if config is not None:
+                self.config = config
+            self._progress = progress_callback or _NOP
+            try:
+                yield self
+            finally:
+                self.config, self._progress = previous
+
+    def close(self):
+        """Release the engine's clients and DB handle.
+
+        Waits for a run in progress (see run_session()) to finish first.
+        """
+        with self._run_lock:
+            for resource in (self.zotero, self.nlm, self.db):
+                try:
+                    resource.close()
+                except Exception as e:
+                    logger.warning("Error closing %s: %s",
+                                   type(resource).__name__, e)
+
+    def _zotero(self, method: str, *args, **kwargs):
+        """Call a ZoteroClient method under the engine's concurrency cap."""
+        return self._zotero_throttle.call(
+            getattr(self.zotero, method), *args, **kwargs
+        )
+
+    def _get_sources_cached(self, notebook_id: str,
+                            ttl: float = _SOURCES_TTL) -> List[NLMSource]:
+        """list_sources() with a short in-process TTL.
+
+        The returned list is the cached one; uploads append to it
+        (see _sync_collection_forward) rather than forcing a refetch.
+        """
+        cached = self._sources_cache.get(notebook_id)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        sources = self.nlm.list_sources(notebook_id)
+        self._sources_cache[notebook_id] = (time.monotonic(), sources)
+        return sources
 
     def _emit(self, msg: str):
         """Emit a progress message."""
         logger.info(msg)
         self._progress(msg)
 
-    def sync_all(self, collection_keys: Optional[List[str]] = None) -> FullSyncResult:
+    def _emit_lazy(self, fmt: str, *args):
+        """Like _emit(fmt % args), but skips formatting when nobody listens."""
+        if self._progress is _NOP and not logger.isEnabledFor(logging.INFO):
+            return
+        self._emit(fmt % args if args else fmt)
+
+    def sync_all(self, collection_keys: Optional[List[str]] = None,
+                 verbose: bool = True) -> FullSyncResult:
         """
         Run a full bidirectional sync.
 
         Args:
             collection_keys: Specific Zotero collection keys to sync.
                              If None, syncs all enabled collections from config.
+            verbose: Fill result.log with per-collection lines (headless
+                     callers that only need the counts can pass False).
         """
         result = FullSyncResult()
 
@@ -106,14 +234,21 @@ class SyncEngine:
 
         # Get collection details from Zotero
         self._emit("Reading Zotero collections...")
-        all_collections = self.zotero.get_collections()
+        all_collections = self._zotero("get_collections")
         coll_map = {c.key: c for c in all_collections}
+        if any(key not in coll_map for key in keys):
+            # The listing may be cached from before the collection was
+            # created (e.g. selected after a GUI refresh); refetch once
+            self.zotero.invalidate_collections_cache()
+            all_collections = self._zotero("get_collections")
+            coll_map = {c.key: c for c in all_collections}
 
         for key in keys:
             coll = coll_map.get(key)
             if not coll:
                 result.errors.append(f"Collection {key} not found in Zotero")
-                result.log.append(f"⚠️ Collection {key} not found")
+                if verbose:
+                    result.log.append(f"⚠️ Collection {key} not found")
                 continue
 
             self._emit(f"Syncing collection: {coll.name}...")
@@ -124,23 +259,26 @@ class SyncEngine:
             result.items_uploaded += fwd_result.items_synced
             result.items_skipped += fwd_result.items_skipped
             result.errors.extend(fwd_result.errors)
-            result.log.append(
-                f"✅ {coll.name}: {fwd_result.items_synced} uploaded, "
-                f"{fwd_result.items_skipped} skipped"
-            )
+            if verbose:
+                result.log.append(
+                    f"✅ {coll.name}: {fwd_result.items_synced} uploaded, "
+                    f"{fwd_result.items_skipped} skipped"
+                )
 
             # Reverse sync: NotebookLM → Zotero (if enabled)
             if self.config.sync.sync_notes_back:
                 rev_result = self._sync_collection_reverse(coll)
                 result.notes_synced_back += rev_result.items_synced
                 result.errors.extend(rev_result.errors)
-                if rev_result.items_synced > 0:
+                if verbose and rev_result.items_synced > 0:
                     result.log.append(
                         f"🔄 {coll.name}: {rev_result.items_synced} notes synced back"
                     )
 
         self.db.log("full_sync", "success" if result.success else "partial",
                     result.summary())
+        # Written in the background; make it visible before returning
+        self.db.flush_logs()
         self._emit("Sync complete!")
         return result
 
@@ -154,6 +292,10 @@ class SyncEngine:
         """
         result = SyncResult(success=True, message="")
         errors = []
+        download_dir = None
+        # Rows for uploaded items, written in batches of _UPSERT_BATCH and
+        # always flushed in the finally block (uploads can't be undone)
+        synced_rows = []
 
         try:
             # Step 1: Find or create the NotebookLM notebook
@@ -164,79 +306,88 @@ class SyncEngine:
             )
 
             # Step 2: Get existing sources in the notebook (to avoid duplicates)
-            existing_sources = self.nlm.list_sources(notebook.id)
-            existing_titles = {s.title.lower().strip() for s in existing_sources}
+            existing_sources = self._get_sources_cached(notebook.id)
+            existing_titles = {s.norm_title for s in existing_sources}
 
             # Step 3: Get items from Zotero
             self._emit(f"  Reading items from {collection.name}...")
-            items = self.zotero.get_collection_items(collection.key)
+            items = self._zotero("get_collection_items", collection.key)
 
             if not items:
                 result.message = f"No items in {collection.name}"
                 return result
 
             # Step 4: Process each item
-            download_dir = tempfile.mkdtemp(prefix="citebridge_")
+            # Already-synced items for this collection, fetched in one query
+            sync_map = self.db.load_sync_map(collection.key)
 
+            pending = []
             for item in items:
-                try:
-                    # Check if already synced
-                    if self.db.is_item_synced(item.key, collection.key):
-                        result.items_skipped += 1
-                        continue
-
-                    # Check if title already exists in notebook
-                    if item.title.lower().strip() in existing_titles:
-                        self._emit(f"  ⏭️ Already in notebook: {item.title}")
-                        self.db.upsert_item(item.key, collection.key, item.title)
-                        result.items_skipped += 1
-                        continue
-
-                    # Get the PDF
-                    pdf_path = self.zotero.get_item_pdf(item.key, download_dir)
-                    if not pdf_path:
-                        self._emit(f"  ⚠️ No PDF for: {item.title}")
-                        # Still record as synced (it's a non-PDF item)
-                        self.db.upsert_item(item.key, collection.key, item.title)
-                        result.items_skipped += 1
-                        continue
-
-                    # Check file size
-                    size = file_size_mb(pdf_path)
-                    if size > self.config.sync.max_file_size_mb:
-                        self._emit(
-                            f"  ⚠️ Skipping {item.title} ({size:.1f}MB > "
-                            f"{self.config.sync.max_file_size_mb}MB limit)"
-                        )
+                # Check if already synced
+                if item.key in sync_map:
+                    result.items_skipped += 1
+                else:
+                    pending.append(item)
+
+            # Only create a download directory if something may be fetched
+            if pending:
+                self._zotero("resolve_pdf_keys", collection.key, pending)
+                download_dir = tempfile.mkdtemp(prefix="citebridge_")
+
+            # Items are downloaded/uploaded on background threads; progress
+            # messages and result counts are handled here, on the caller's
+            # thread (Streamlit widgets can't be updated from workers).
+            workers = max(1, self.config.sync.upload_concurrency or 4)
+            if workers > 1:
+                outcomes = self._process_items_pooled(
+                    pending, collection, notebook, existing_titles,
+                    download_dir, workers,
+                )
+            else:
+                outcomes = self._process_items_pipelined(
+                    pending, collection, notebook, existing_titles,
+                    download_dir,
+                )
+            # closing(): if the loop exits early (e.g. the progress callback
+            # raises), stop the workers before download_dir is removed
+            with closing(outcomes):
+                for outcome in outcomes:
+                    # Record the row before anything that may raise
+                    if outcome.row is not None:
+                        synced_rows.append(outcome.row)
+                        if len(synced_rows) >= _UPSERT_BATCH:
+                            self.db.upsert_items_many(synced_rows)
+                            synced_rows.clear()
+                    for fmt, *args in outcome.messages:
+                        self._emit_lazy(fmt, *args)
+                    if outcome.source is not None:
+                        existing_sources.append(outcome.source)
+                    if outcome.status == "synced":
+                        result.items_synced += 1
+                    elif outcome.status == "skipped":
                         result.items_skipped += 1
-                        continue
-
-                    # Upload to NotebookLM
-                    self._emit(f"  📄 Uploading: {item.title}...")
-                    source = self.nlm.add_pdf_source(
-                        notebook.id, pdf_path, wait=True
-                    )
-
-                    # Record in state DB
-                    fhash = file_hash(pdf_path)
-                    self.db.upsert_item(
-                        item.key, collection.key, item.title,
-                        file_hash=fhash, nlm_source_id=source.id,
-                    )
-                    result.items_synced += 1
-                    self._emit(f"  ✅ Uploaded: {item.title}")
-
-                except Exception as e:
-                    error_msg = f"Error syncing {item.title}: {e}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                    self._emit(f"  ❌ {error_msg}")
+                    else:
+                        logger.error(outcome.error)
+                        errors.append(outcome.error)
 
         except Exception as e:
             error_msg = f"Error syncing collection {collection.name}: {e}"
             logger.error(error_msg)
             errors.append(error_msg)
             result.success = False
+        finally:
+            # Also runs on BaseExceptions (e.g. a Streamlit rerun raised
+            # from the progress callback), so uploaded items are never
+            # re-uploaded as duplicates on the next sync
+            if synced_rows:
+                try:
+                    self.db.upsert_items_many(synced_rows)
+                except Exception as e:
+                    logger.error("Error recording synced items for %s: %s",
+                                 collection.name, e)
+            self.zotero.flush_pdf_cache()
+            if download_dir:
+                shutil.rmtree(download_dir, ignore_errors=True)
 
         result.errors = errors
         result.message = (
@@ -245,6 +396,235 @@ class SyncEngine:
         )
         return result
 
+    def _process_items_pooled(self, items: List[ZoteroItem],
+                              collection: ZoteroCollection,
+                              notebook: NLMNotebook, existing_titles: Set[str],
+                              download_dir: str, workers: int):
+        """Yield outcomes as items finish on a pool of ``workers`` threads.
+
+        Workers report each upload as it starts; the progress message for
+        it is emitted here, on the consumer's thread.
+        """
+        uploading = queue.SimpleQueue()
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="sync-item") as pool:
+            futures = [
+                pool.submit(self._process_item, item, collection,
+                            notebook, existing_titles, download_dir,
+                            uploading.put)
+                for item in items
+            ]
+            try:
+                not_done = set(futures)
+                while not_done:
+                    done, not_done = wait(not_done, timeout=_PROGRESS_POLL,
+                                          return_when=FIRST_COMPLETED)
+                    while not uploading.empty():
+                        self._emit_lazy("  📄 Uploading: %s...",
+                                        uploading.get().title)
+                    for future in done:
+                        yield future.result()
+            finally:
+                # Consumer stopped early: don't start the remaining items
+                for future in futures:
+                    future.cancel()
+
+    def _process_items_pipelined(self, items: List[ZoteroItem],
+                                 collection: ZoteroCollection,
+                                 notebook: NLMNotebook, existing_titles: Set[str],
+                                 download_dir: str):
+        """Yield outcomes one item at a time, downloading ahead of uploads.
+
+        A background thread fetches PDFs into a small queue while the
+        current item uploads, overlapping the Zotero and NotebookLM legs.
+        If the consumer stops early, the producer is told to stop and
+        joined before this generator finishes closing.
+        """
+        fetched = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def _put(entry) -> bool:
+            while not stop.is_set():
+                try:
+                    fetched.put(entry, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def _producer():
+            for item in items:
+                if stop.is_set() or not _put((item, self._fetch_item(
+                    item, collection, existing_titles, download_dir
+                ))):
+                    return
+            _put(None)
+
+        producer = threading.Thread(target=_producer, name="sync-prefetch",
+                                    daemon=True)
+        producer.start()
+        try:
+            while True:
+                entry = fetched.get()
+                if entry is None:
+                    return
+                item, pdf = entry
+                if isinstance(pdf, _ItemOutcome):
+                    yield pdf
+                else:
+                    self._emit_lazy("  📄 Uploading: %s...", item.title)
+                    yield self._upload_item(item, collection, notebook, pdf,
+                                            download_dir)
+        finally:
+            stop.set()
+            producer.join()
+
+    def _process_item(self, item: ZoteroItem, collection: ZoteroCollection,
+                      notebook: NLMNotebook, existing_titles: Set[str],
+                      download_dir: str,
+                      on_upload: Optional[Callable[[ZoteroItem], None]] = None
+                      ) -> _ItemOutcome:
+        """Download one item's PDF and upload it to the notebook.
+
+        Runs on a worker thread, so it only reads shared state (and the
+        state DB) and reports back through the returned outcome and
+        ``on_upload``, called just before the upload starts.
+        """
+        pdf = self._fetch_item(item, collection, existing_titles, download_dir)
+        if isinstance(pdf, _ItemOutcome):
+            return pdf
+        if on_upload is not None:
+            on_upload(item)
+        return self._upload_item(item, collection, notebook, pdf, download_dir)
+
+    def _fetch_item(self, item: ZoteroItem, collection: ZoteroCollection,
+                    existing_titles: Set[str], download_dir: str):
+        """Get an item's PDF path, or the outcome if it should not be uploaded."""
+        try:
+            # Check if title already exists in notebook
+            if item.norm_title in existing_titles:
+                return _ItemOutcome(
+                    "skipped",
+                    row=(item.key, collection.key, item.title, "", "", None, None),
+                    messages=[("  ⏭️ Already in notebook: %s", item.title)],
+                )
+
+            # Get the PDF
+            pdf_path = self._zotero(
+                "get_item_pdf", item.key, download_dir,
+                pdf_key=item.pdf_key, title=item.title,
+            )
+            if not pdf_path:
+                # Still record as synced (it's a non-PDF item)
+                return _ItemOutcome(
+                    "skipped",
+                    row=(item.key, collection.key, item.title, "", "", None, None),
+                    messages=[("  ⚠️ No PDF for: %s", item.title)],
+                )
+            return pdf_path
+
+        except Exception as e:
+            return self._item_error(item, e)
+
+    def _upload_item(self, item: ZoteroItem, collection: ZoteroCollection,
+                     notebook: NLMNotebook, pdf_path: str,
+                     download_dir: str) -> _ItemOutcome:
+        """Size-check, upload and hash one downloaded PDF.
+
+        A PDF downloaded into ``download_dir`` is deleted afterwards;
+        files found in local Zotero storage are left alone.
+        """
+        try:
+            # Check file size
+            st = os.stat(pdf_path)
+            size = st.st_size / (1024 * 1024)
+            if size > self.config.sync.max_file_size_mb:
+                return _ItemOutcome("skipped", messages=[(
+                    "  ⚠️ Skipping %s (%.1fMB > %sMB limit)",
+                    item.title, size, self.config.sync.max_file_size_mb,
+                )])
+
+            # Upload to NotebookLM
+            source = self.nlm.add_pdf_source(notebook.id, pdf_path, wait=True)
+
+            # Reuse the recorded hash if the file's size and mtime still match
+            fingerprint = self.db.get_item_fingerprint(item.key)
+            if fingerprint and fingerprint[:2] == (st.st_size, st.st_mtime_ns):
+                fhash = fingerprint[2]
+            else:
+                fhash = file_hash(pdf_path)
+            return _ItemOutcome(
+                "synced",
+                row=(item.key, collection.key, item.title, fhash, source.id,
+                     st.st_size, st.st_mtime_ns),
+                source=source,
+                messages=[("  ✅ Uploaded: %s", item.title)],
+            )
+
+        except Exception as e:
+            return self._item_error(item, e)
+        finally:
+            if os.path.dirname(pdf_path) == download_dir:
+                try:
+                    os.unlink(pdf_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _item_error(item: ZoteroItem, exc: Exception) -> _ItemOutcome:
+        error_msg = f"Error syncing {item.title}: {exc}"
+        return _ItemOutcome("error", messages=[("  ❌ %s", error_msg)],
+                            error=error_msg)
+
+    @staticmethod
+    def _build_title_index(items: List[ZoteroItem]):
+        """Index items by normalized title and by title word.
+
+        Returns (item_by_title, token_index), where token_index maps each
+        word to the (title, tokens, item) entries whose title contains it.
+        """
+        item_by_title = {}
+        token_index: Dict[str, List[tuple]] = {}
+        for item in items:
+            title = item.norm_title
+            item_by_title[title] = item
+            tokens = frozenset(title.split())
+            entry = (title, tokens, item)
+            for token in tokens:
+                token_index.setdefault(token, []).append(entry)
+        return item_by_title, token_index
+
+    @staticmethod
+    def _match_note_title(note_title: str, item_by_title: Dict[str, ZoteroItem],
+                          token_index: Dict[str, List[tuple]]
+                          ) -> Optional[ZoteroItem]:
+        """Find the Zotero item a NotebookLM note title refers to.
+
+        An exact title match wins.  Otherwise only items sharing a word
+        with the note are considered; of those whose title contains (or is
+        contained in) the note title, the one with the highest word-set
+        Jaccard similarity is returned.
+        """
+        note_title = note_title.lower().strip()
+        exact = item_by_title.get(note_title)
+        if exact is not None:
+            return exact
+
+        note_tokens = frozenset(note_title.split())
+        best, best_score = None, 0.0
+        seen = set()
+        for token in note_tokens:
+            for title, tokens, item in token_index.get(token, ()):
+                if title in seen:
+                    continue
+                seen.add(title)
+                if title not in note_title and note_title not in title:
+                    continue
+                score = len(tokens & note_tokens) / len(tokens | note_tokens)
+                if score > best_score:
+                    best, best_score = item, score
+        return best
+
     def _sync_collection_reverse(self, collection: ZoteroCollection) -> SyncResult:
         """
         Reverse sync: NotebookLM → Zotero.
@@ -269,11 +649,8 @@ class SyncEngine:
                 return result
 
             # Get Zotero items for matching
-            zotero_items = self.zotero.get_collection_items(collection.key)
-            # Build a simple lookup by title
-            item_by_title = {}
-            for item in zotero_items:
-                item_by_title[item.title.lower().strip()] = item
+            zotero_items = self._zotero("get_collection_items", collection.key)
+            item_by_title, token_index = self._build_title_index(zotero_items)
 
             for note in nlm_notes:
                 try:
@@ -282,17 +659,14 @@ class SyncEngine:
                         continue
 
                     # Try to find a matching Zotero item
-                    # (simple title matching — could be improved)
-                    matched_item = None
-                    note_title_lower = note.title.lower().strip()
-                    for title, item in item_by_title.items():
-                        if title in note_title_lower or note_title_lower in title:
-                            matched_item = item
-                            break
+                    matched_item = self._match_note_title(
+                        note.title, item_by_title, token_index
+                    )
 
                     if matched_item:
                         # Create note attached to the matched item
-                        zotero_note_key = self.zotero.create_note(
+                        zotero_note_key = self._zotero(
+                            "create_note",
                             matched_item.key,
                             title=f"NotebookLM: {note.title}",
                             content=note.content,
@@ -304,15 +678,15 @@ class SyncEngine:
                             zotero_note_key=zotero_note_key or "",
                         )
                         result.items_synced += 1
-                        self._emit(
-                            f"  🔄 Note synced to Zotero: {note.title} "
-                            f"→ {matched_item.title}"
+                        self._emit_lazy(
+                            "  🔄 Note synced to Zotero: %s → %s",
+                            note.title, matched_item.title,
                         )
                     else:
                         # Record as synced even without match to avoid retry
                         self.db.record_nlm_note_sync(notebook_id, note.id)
-                        self._emit(
-                            f"  ⏭️ No Zotero match for note: {note.title}"
+                        self._emit_lazy(
+                            "  ⏭️ No Zotero match for note: %s", note.title
                         )
 
                 except Exception as e:
@@ -363,7 +737,8 @@ class SyncEngine:
         try:
             # Step 1: Create or find the Zotero collection
             self._emit(f"📁 Creating Zotero collection: {coll_name}...")
-            zotero_coll_key = self.zotero.find_or_create_collection(
+            zotero_coll_key = self._zotero(
+                "find_or_create_collection",
                 f"NLM: {coll_name}"
             )
             if not zotero_coll_key:
@@ -377,7 +752,7 @@ class SyncEngine:
                 sources = self.nlm.get_all_sources_with_content(notebook_id)
             else:
                 self._emit(f"📋 Reading source list from {coll_name}...")
-                raw_sources = self.nlm.list_sources(notebook_id)
+                raw_sources = self._get_sources_cached(notebook_id)
                 sources = [
                     NLMSourceFull(
                         id=s.id, title=s.title,
@@ -393,56 +768,71 @@ class SyncEngine:
 
             self._emit(f"  Found {len(sources)} sources to import")
 
-            # Step 3: Import each source as a Zotero item
-            for src in sources:
-                try:
-                    # Check if already imported (by title match in collection)
-                    existing_items = self.zotero.get_collection_items(zotero_coll_key)
-                    already_exists = any(
-                        item.title.lower().strip() == src.title.lower().strip()
-                        for item in existing_items
-                    )
-                    if already_exists:
-                        self._emit(f"  ⏭️ Already in Zotero: {src.title}")
-                        result.items_skipped += 1
-                        continue
-
-                    # Create the Zotero item
-                    self._emit(f"  📥 Importing: {src.title} [{src.source_type}]")
-                    item_key = self.zotero.import_source_as_item(
-                        source_type=src.source_type,
-                        title=src.title,
-                        url=src.url,
-                        fulltext=src.content,
-                        collection_key=zotero_coll_key,
-                        tags=["notebooklm-import", f"nlm:{coll_name}"],
-                    )
+            # Titles already in the collection, fetched once and kept current
+            existing_titles = {
+                item.norm_title
+                for item in self._zotero("get_collection_items", zotero_coll_key)
+            }
 
-                    if item_key:
-                        result.items_synced += 1
-                        self._emit(f"  ✅ Imported: {src.title}")
-
-                        # Record in state DB
-                        self.db.upsert_item(
-                            zotero_key=item_key,
-                            collection_key=zotero_coll_key,
-                            title=src.title,
-                            nlm_source_id=src.id,
-                        )
-                    else:
-                        errors.append(f"Failed to import: {src.title}")
-                        self._emit(f"  ❌ Failed to import: {src.title}")
+            # State rows are written in one transaction after the loop,
+            # so no write lock is held across Zotero API calls
+            imported_rows = []
 
+            # Step 3: Import each source as a Zotero item.  New sources are
+            # collected first and created in batched API writes.
+            to_import = []
+            for src in sources:
+                # Check if already imported (by title match in collection)
+                src_title = src.norm_title
+                if src_title in existing_titles:
+                    self._emit_lazy("  ⏭️ Already in Zotero: %s", src.title)
+                    result.items_skipped += 1
+                    continue
+                existing_titles.add(src_title)
+
+                self._emit_lazy(
+                    "  📥 Importing: %s [%s]", src.title, src.source_type
+                )
+                to_import.append(src)
+
+            item_keys = []
+            if to_import:
+                try:
+                    item_keys = self._zotero("import_sources_as_items", [
+                        {
+                            "source_type": src.source_type,
+                            "title": src.title,
+                            "url": src.url,
+                            "fulltext": src.content,
+                            "collection_key": zotero_coll_key,
+                            "tags": ["notebooklm-import", f"nlm:{coll_name}"],
+                        }
+                        for src in to_import
+                    ])
                 except Exception as e:
-                    error_msg = f"Error importing {src.title}: {e}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                    self._emit(f"  ❌ {error_msg}")
+                    logger.error(f"Error importing sources into {coll_name}: {e}")
+                    item_keys = [None] * len(to_import)
 
-            # Record the collection mapping
-            self.db.upsert_collection(
-                zotero_coll_key, coll_name, notebook_id
-            )
+            for src, item_key in zip(to_import, item_keys):
+                if item_key:
+                    result.items_synced += 1
+                    self._emit_lazy("  ✅ Imported: %s", src.title)
+
+                    # Record in state DB
+                    imported_rows.append((
+                        item_key, zotero_coll_key, src.title, "", src.id,
+                        None, None,
+                    ))
+                else:
+                    errors.append(f"Failed to import: {src.title}")
+                    self._emit_lazy("  ❌ Failed to import: %s", src.title)
+
+            # Record the imported items and the collection mapping
+            with self.db.transaction():
+                self.db.upsert_items_many(imported_rows)
+                self.db.upsert_collection(
+                    zotero_coll_key, coll_name, notebook_id
+                )
 
         except Exception as e:
             error_msg = f"Error importing notebook {coll_name}: {e}"
@@ -461,6 +851,7 @@ class SyncEngine:
             "success" if result.success else "error",
             result.message,
         )
+        self.db.flush_logs()
         return result
 
     def import_all_notebooks(self, notebook_ids: List[str],
@@ -501,22 +892,24 @@ class SyncEngine:
     # ══════════════════════════════════════════════════════
 
     def test_connections(self) -> Dict[str, bool]:
-        """Test connections to both services."""
+        """Test connections to both services (probed concurrently)."""
         results = {}
 
-        self._emit("Testing Zotero connection...")
-        results["zotero"] = self.zotero.test_connection()
-        self._emit(
-            "  ✅ Zotero connected" if results["zotero"]
-            else "  ❌ Zotero connection failed"
-        )
-
-        self._emit("Testing NotebookLM connection...")
-        results["notebooklm"] = self.nlm.test_connection()
-        self._emit(
-            "  ✅ NotebookLM connected" if results["notebooklm"]
-            else "  ❌ NotebookLM connection failed"
-        )
+        self._emit("Testing Zotero and NotebookLM connections...")
+        with ThreadPoolExecutor(max_workers=2,
+                                thread_name_prefix="conn-test") as pool:
+            futures = {
+                pool.submit(self.zotero.test_connection): "zotero",
+                pool.submit(self.nlm.test_connection): "notebooklm",
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                results[name] = future.result()
+                label = "Zotero" if name == "zotero" else "NotebookLM"
+                self._emit(
+                    f"  ✅ {label} connected" if results[name]
+                    else f"  ❌ {label} connection failed"
+                )
 
         return results
 
@@ -3,19 +3,188 @@ Zotero API client — wraps pyzotero for reading collections,
 items, and PDFs from a user's Zotero library.
 """
 
+import atexit
+import copy
+import functools
+import html
+import json
 import os
 import logging
+import re
+import shutil
+import sqlite3
+import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
 
+import httpx
 from pyzotero import zotero
 
+from utils import sanitize_filename
+
 logger = logging.getLogger(__name__)
 
+# Attempts for a rate-limited (HTTP 429) API call, and the wait used when
+# the response carries no Retry-After header
+_API_ATTEMPTS = 3
+_DEFAULT_RETRY_AFTER = 5.0
+
+ZOTERO_API_URL = "https://api.zotero.org"
+# Largest page the API serves (its default is 25); everything() then
+# follows the rel=next links with the same size
+_PAGE_SIZE = 100
+
+# Seconds a get_collections() listing is reused
+_COLLECTIONS_TTL = 300.0
+
+# PDF downloads are streamed to disk in chunks of this size
+_DOWNLOAD_CHUNK = 64 * 1024
+
+# Attachments whose file download definitively failed (HTTP 403/404/410),
+# "<library_type>:<library_id>/<attachment_key>" → failed_at, so repeat
+# runs skip them; flushed every _PDF_CACHE_FLUSH_EVERY updates and retried
+# after _PDF_NEGATIVE_TTL seconds.
+PDF_CACHE_FILE = Path.home() / ".cache" / "zoterolm" / "pdf_cache.json"
+_PDF_CACHE_FLUSH_EVERY = 50
+_PDF_NEGATIVE_TTL = 7 * 24 * 3600.0
+
+# Objects per create_items() request (the API's limit), and the note text
+# a batch may carry before it is sent early
+_WRITE_BATCH = 50
+_WRITE_BATCH_CHARS = 2_000_000
+
+# Queries against the desktop client's zotero.sqlite (see
+# _local_collection_items); the per-item queries take (collectionID,)
+_SQL_LOCAL_LIBRARY_USER = "SELECT libraryID FROM libraries WHERE type = 'user'"
+_SQL_LOCAL_LIBRARY_GROUP = "SELECT libraryID FROM groups WHERE groupID = ?"
+_SQL_LOCAL_COLLECTION = "SELECT collectionID FROM collections WHERE key = ? AND libraryID = ?"
+_SQL_LOCAL_ITEMS = """
+    SELECT i.itemID, i.key, t.typeName
+    FROM collectionItems ci
+    JOIN items i ON i.itemID = ci.itemID
+    JOIN itemTypes t ON t.itemTypeID = i.itemTypeID
+    WHERE ci.collectionID = ?
+      AND t.typeName NOT IN ('attachment', 'note', 'annotation')
+      AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+    ORDER BY ci.orderIndex
+"""
+_SQL_LOCAL_FIELDS = """
+    SELECT d.itemID, f.fieldName, v.value
+    FROM collectionItems ci
+    JOIN itemData d ON d.itemID = ci.itemID
+    JOIN fields f ON f.fieldID = d.fieldID
+    JOIN itemDataValues v ON v.valueID = d.valueID
+    WHERE ci.collectionID = ?
+      AND f.fieldName IN ('title', 'date', 'DOI', 'url', 'abstractNote')
+"""
+_SQL_LOCAL_CREATORS = """
+    SELECT ic.itemID, t.creatorType, c.firstName, c.lastName, c.fieldMode
+    FROM collectionItems ci
+    JOIN itemCreators ic ON ic.itemID = ci.itemID
+    JOIN creators c ON c.creatorID = ic.creatorID
+    JOIN creatorTypes t ON t.creatorTypeID = ic.creatorTypeID
+    WHERE ci.collectionID = ?
+    ORDER BY ic.itemID, ic.orderIndex
+"""
+_SQL_LOCAL_TAGS = """
+    SELECT it.itemID, t.name
+    FROM collectionItems ci
+    JOIN itemTags it ON it.itemID = ci.itemID
+    JOIN tags t ON t.tagID = it.tagID
+    WHERE ci.collectionID = ?
+"""
+_SQL_LOCAL_ITEM_COLLECTIONS = """
+    SELECT ci2.itemID, c.key
+    FROM collectionItems ci
+    JOIN collectionItems ci2 ON ci2.itemID = ci.itemID
+    JOIN collections c ON c.collectionID = ci2.collectionID
+    WHERE ci.collectionID = ?
+"""
+# Stored (linkMode 0/1) PDF attachments, oldest first like the web API
+_SQL_LOCAL_PDFS = """
+    SELECT a.parentItemID, i.key
+    FROM collectionItems ci
+    JOIN itemAttachments a ON a.parentItemID = ci.itemID
+    JOIN items i ON i.itemID = a.itemID
+    WHERE ci.collectionID = ?
+      AND a.contentType = 'application/pdf'
+      AND a.linkMode IN (0, 1)
+      AND a.itemID NOT IN (SELECT itemID FROM deletedItems)
+    ORDER BY i.dateAdded
+"""
+# zotero.sqlite stores dates as "YYYY-MM-DD <original string>"
+_LOCAL_DATE_PREFIX = re.compile(r"^\d{4}-\d{2}-\d{2} ")
+
+# NotebookLM source type → Zotero item type (default "document")
+_NLM_TO_ZOTERO = {
+    "web_page": "webpage",
+    "pdf": "journalArticle",
+    "youtube": "videoRecording",
+    "google_docs": "document",
+    "google_slides": "presentation",
+    "google_spreadsheet": "document",
+    "google_drive_audio": "audioRecording",
+    "google_drive_video": "videoRecording",
+    "csv": "document",
+    "docx": "document",
+    "markdown": "document",
+    "pasted_text": "document",
+    "image": "artwork",
+}
+# Fixed fields set on imported items, per Zotero item type
+_IMPORT_TYPE_FIELDS = {
+    "webpage": {"websiteTitle": "NotebookLM Source"},
+    "videoRecording": {"videoRecordingFormat": "YouTube"},
+    "document": {"publisher": "NotebookLM Import"},
+}
+
+
+def _close_pyzotero(zot: zotero.Zotero):
+    """Close the HTTP client/session a pyzotero instance holds, if any.
+
+    Which attribute holds it depends on the pyzotero version.
+    """
+    for attr in ("client", "session"):
+        close = getattr(getattr(zot, attr, None), "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.debug("Error closing pyzotero %s: %s", attr, e)
+
+
+def _header_delay(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After/Backoff header value.
+
+    Accepts both delta-seconds and the HTTP-date form; None if the value
+    is missing or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
 
-@dataclass
+# slots=True needs Python 3.10+; older interpreters get regular dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ZoteroItem:
     """Represents a single Zotero library item (paper, book, etc.)."""
     key: str
@@ -30,9 +199,15 @@ class ZoteroItem:
     collections: List[str] = field(default_factory=list)
     pdf_path: Optional[str] = None  # Local path to PDF if available
     pdf_key: Optional[str] = None   # Zotero key for the PDF attachment
+                                    # ("" = known to have none, None = unknown)
+    # title.lower().strip(), for title matching (derived, not an init arg)
+    norm_title: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.norm_title = self.title.lower().strip()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ZoteroCollection:
     """Represents a Zotero collection (folder)."""
     key: str
@@ -46,7 +221,10 @@ class ZoteroClient:
 
     def __init__(self, library_id: str, api_key: str,
                  library_type: str = "user",
-                 local_storage_path: str = ""):
+                 local_storage_path: str = "",
+                 max_workers: int = 16,
+                 max_pdf_bytes: int = 500 * 1024 * 1024,
+                 http_client: Optional[httpx.Client] = None):
         """
         Initialize the Zotero client.
 
@@ -55,14 +233,139 @@ class ZoteroClient:
             api_key: Your Zotero API key
             library_type: "user" or "group"
             local_storage_path: Optional path to Zotero/storage/ for direct PDF access
+            max_workers: Max concurrent attachment lookups/downloads
+            max_pdf_bytes: Downloads larger than this are abandoned
+            http_client: Optional httpx.Client for file downloads; by
+                default one keep-alive pool sized to max_workers is created
         """
         self.library_id = library_id
         self.api_key = api_key
         self.library_type = library_type
         self.local_storage_path = local_storage_path
+        self.max_workers = max_workers
+        self.max_pdf_bytes = max_pdf_bytes
+        # Shared by all download threads so connections (and TLS sessions)
+        # to the API and its file host are reused instead of re-handshaken
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.Client(
+            follow_redirects=True,
+            timeout=60.0,
+            transport=httpx.HTTPTransport(
+                retries=2,  # connection failures only; 429s are handled below
+                limits=httpx.Limits(max_connections=max_workers,
+                                    max_keepalive_connections=max_workers),
+            ),
+        )
+
+        # pyzotero keeps per-request state (query params, last response) on
+        # the Zotero object, so each thread gets its own instance
+        self._local = threading.local()
+        # Every thread's instance, so close() can release them
+        self._zots: List[zotero.Zotero] = []
+        self._zots_lock = threading.Lock()
+        self._local.zot = self._new_zot()
+        # Download workers for get_item_pdfs_for_collection(), started on
+        # first use and shared by every call, so their pyzotero instances
+        # are reused across collections
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._api_slots = threading.BoundedSemaphore(max_workers)
+        # Item templates are static per type: fetch each once per client
+        # (shared by all threads) and hand out deep copies
+        self._item_template = functools.lru_cache(maxsize=32)(
+            lambda item_type: self._api(self.zot.item_template, item_type)
+        )
+        # (fetched_at, collections, name → key) — see get_collections()
+        self._collections_cache: Optional[
+            Tuple[float, List[ZoteroCollection], Dict[str, str]]
+        ] = None
+        # attachment key → PDF path under local_storage_path, built on
+        # first use — see _find_local_pdf()
+        self._local_attachment_index: Optional[Dict[str, str]] = None
+        self._local_index_lock = threading.Lock()
+        # Loaded from PDF_CACHE_FILE on first use — see _known_missing()
+        self._pdf_cache: Optional[Dict[str, float]] = None
+        self._pdf_cache_dirty = 0
+        self._pdf_cache_lock = threading.Lock()
+        # Created on the first download without a download_dir and reused
+        # for the rest of the process — see _session_download_dir()
+        self._session_tmpdir: Optional[str] = None
+        self._session_tmpdir_lock = threading.Lock()
+        logger.info(
+            "ZoteroClient initialized for %s library %s",
+            library_type, library_id,
+        )
+
+    def close(self):
+        """Stop the download workers and release every connection pool.
+
+        The download pool is left open if it was injected.
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        with self._zots_lock:
+            zots, self._zots = self._zots, []
+        for zot in zots:
+            _close_pyzotero(zot)
+        if self._owns_http:
+            self._http.close()
+
+    @property
+    def zot(self) -> zotero.Zotero:
+        """The calling thread's pyzotero instance."""
+        zot = getattr(self._local, "zot", None)
+        if zot is None:
+            zot = self._new_zot()
+            self._local.zot = zot
+        return zot
+
+    def _new_zot(self) -> zotero.Zotero:
+        zot = zotero.Zotero(self.library_id, self.library_type, self.api_key)
+        with self._zots_lock:
+            self._zots.append(zot)
+        return zot
+
+    def _worker_pool(self) -> ThreadPoolExecutor:
+        """The shared download worker pool (see get_item_pdfs_for_collection)."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="zotero-pdf",
+                )
+            return self._pool
+
+    def _api(self, fn, *args, **kwargs):
+        """Run a pyzotero call under the concurrency cap, retrying on 429."""
+        for attempt in range(_API_ATTEMPTS):
+            with self._api_slots:
+                try:
+                    return fn(*args, **kwargs)
+                except Exception:
+                    status, delay = self.rate_limit_state()
+                    if status != 429 or attempt == _API_ATTEMPTS - 1:
+                        raise
+            delay = delay or _DEFAULT_RETRY_AFTER
+            logger.warning("Zotero rate limit hit; retrying in %.0fs", delay)
+            time.sleep(delay)
 
-        self.zot = zotero.Zotero(library_id, library_type, api_key)
-        logger.info(f"ZoteroClient initialized for {library_type} library {library_id}")
+    def rate_limit_state(self) -> Tuple[int, float]:
+        """(status code, requested delay in seconds) of the last API response.
+
+        The delay comes from Zotero's Retry-After or Backoff header and is
+        0.0 when neither is present.  Reflects the calling thread's last
+        request (see the zot property).
+        """
+        response = getattr(self.zot, "request", None)
+        status = getattr(response, "status_code", 0) or 0
+        headers = getattr(response, "headers", None) or {}
+        for name in ("Retry-After", "Backoff"):
+            delay = _header_delay(headers.get(name))
+            if delay is not None:
+                return status, delay
+        return status, 0.0
 
     def test_connection(self) -> bool:
         """Test if the API connection works."""
@@ -70,13 +373,26 @@ class ZoteroClient:
             self.zot.collections(limit=1)
             return True
         except Exception as e:
-            logger.error(f"Zotero connection test failed: {e}")
+            logger.error("Zotero connection test failed: %s", e)
             return False
 
+    def invalidate_collections_cache(self):
+        """Make the next get_collections() call refetch from the API."""
+        self._collections_cache = None
+
     def get_collections(self) -> List[ZoteroCollection]:
-        """Get all collections in the library."""
+        """Get all collections in the library.
+
+        The listing is reused for _COLLECTIONS_TTL seconds; collections
+        created through this client are added to it.
+        """
+        cached = self._collections_cache
+        if cached and time.monotonic() - cached[0] < _COLLECTIONS_TTL:
+            return list(cached[1])
         try:
-            raw_collections = self.zot.everything(self.zot.collections())
+            raw_collections = self._api(lambda: self.zot.everything(
+                self.zot.collections(limit=_PAGE_SIZE)
+            ))
             collections = []
             for c in raw_collections:
                 data = c.get("data", c)
@@ -95,10 +411,14 @@ class ZoteroClient:
                     parent_key=data.get("parentCollection", None) or None,
                     num_items=num_items,
                 ))
-            logger.info(f"Found {len(collections)} collections")
-            return collections
+            logger.info("Found %d collections", len(collections))
+            by_name: Dict[str, str] = {}
+            for c in collections:
+                by_name.setdefault(c.name, c.key)
+            self._collections_cache = (time.monotonic(), collections, by_name)
+            return list(collections)
         except Exception as e:
-            logger.error(f"Failed to get collections: {e}")
+            logger.error("Failed to get collections: %s", e)
             return []
 
     def get_collection_items(self, collection_key: str) -> List[ZoteroItem]:
@@ -106,21 +426,23 @@ class ZoteroClient:
         Get all items in a specific collection.
         Returns only top-level items (not attachments/notes).
         Uses everything() for full pagination beyond 100-item default.
+
+        With local storage configured, the desktop client's zotero.sqlite
+        is read instead when it knows the collection.
         """
+        local_items = self._local_collection_items(collection_key)
+        if local_items is not None:
+            return local_items
+
         try:
             # Use collection_items_top to skip child attachments/notes,
             # and everything() to paginate beyond the 100-item default
-            raw_items = self.zot.everything(
-                self.zot.collection_items_top(collection_key)
-            )
-            items = []
-            for item in raw_items:
-                data = item.get("data", item)
-                # Double-check: skip any remaining attachment/note types
-                if data.get("itemType") in ("attachment", "note"):
-                    continue
-
-                z_item = ZoteroItem(
+            raw_items = self._api(lambda: self.zot.everything(
+                self.zot.collection_items_top(collection_key, limit=_PAGE_SIZE)
+            ))
+            pdf_key_from_links = self._pdf_key_from_links
+            items = [
+                ZoteroItem(
                     key=data.get("key", ""),
                     title=data.get("title", "Untitled"),
                     item_type=data.get("itemType", ""),
@@ -129,42 +451,214 @@ class ZoteroClient:
                     doi=data.get("DOI", ""),
                     url=data.get("url", ""),
                     abstract=data.get("abstractNote", ""),
-                    tags=[t.get("tag", "") for t in data.get("tags", [])],
+                    tags=[t.get("tag", "") for t in data.get("tags", ())],
                     collections=data.get("collections", []),
+                    pdf_key=pdf_key_from_links(item),
                 )
-                items.append(z_item)
+                for item in raw_items
+                for data in (item.get("data", item),)
+                # Double-check: skip any remaining attachment/note types
+                if data.get("itemType") not in ("attachment", "note")
+            ]
 
-            logger.info(f"Found {len(items)} items in collection {collection_key}")
+            logger.info("Found %d items in collection %s", len(items), collection_key)
             return items
         except Exception as e:
-            logger.error(f"Failed to get items for collection {collection_key}: {e}")
+            logger.error("Failed to get items for collection %s: %s", collection_key, e)
             return []
 
-    def get_item_pdf(self, item_key: str, download_dir: Optional[str] = None) -> Optional[str]:
+    def _open_local_db(self) -> Optional[sqlite3.Connection]:
+        """Open the desktop client's zotero.sqlite read-only, if present.
+
+        It sits next to the storage/ directory.  Zotero holds a lock on the
+        file while running, so it is opened immutable.
+        """
+        if not self.local_storage_path:
+            return None
+        db_path = Path(self.local_storage_path).parent / "zotero.sqlite"
+        if not db_path.is_file():
+            return None
+        try:
+            conn = sqlite3.connect(
+                f"{db_path.as_uri()}?mode=ro&immutable=1", uri=True
+            )
+            conn.execute("PRAGMA query_only=1")
+            return conn
+        except sqlite3.Error as e:
+            logger.debug("Local Zotero database unavailable: %s", e)
+            return None
+
+    def _local_collection_items(self, collection_key: str) -> Optional[List[ZoteroItem]]:
+        """Collection items read from the local zotero.sqlite.
+
+        Returns the same ZoteroItem fields as the API listing (with
+        ``pdf_key`` resolved, so no children() lookups are needed), or None
+        if there is no local database or it doesn't know the collection —
+        the caller then falls back to the API.
+        """
+        conn = self._open_local_db()
+        if conn is None:
+            return None
+        try:
+            if self.library_type == "group":
+                row = conn.execute(_SQL_LOCAL_LIBRARY_GROUP, (self.library_id,)).fetchone()
+            else:
+                row = conn.execute(_SQL_LOCAL_LIBRARY_USER).fetchone()
+            if row is None:
+                return None
+            row = conn.execute(_SQL_LOCAL_COLLECTION, (collection_key, row[0])).fetchone()
+            if row is None:
+                return None
+            params = (row[0],)
+
+            fields: Dict[int, Dict[str, str]] = {}
+            for item_id, name, value in conn.execute(_SQL_LOCAL_FIELDS, params):
+                fields.setdefault(item_id, {})[name] = str(value)
+            creators: Dict[int, List[Dict[str, str]]] = {}
+            for item_id, ctype, first, last, mode in conn.execute(_SQL_LOCAL_CREATORS, params):
+                creators.setdefault(item_id, []).append(
+                    {"creatorType": ctype, "name": last or ""} if mode == 1 else
+                    {"creatorType": ctype, "firstName": first or "", "lastName": last or ""}
+                )
+            tags: Dict[int, List[str]] = {}
+            for item_id, name in conn.execute(_SQL_LOCAL_TAGS, params):
+                tags.setdefault(item_id, []).append(name)
+            collections: Dict[int, List[str]] = {}
+            for item_id, key in conn.execute(_SQL_LOCAL_ITEM_COLLECTIONS, params):
+                collections.setdefault(item_id, []).append(key)
+            pdf_keys: Dict[int, str] = {}
+            for item_id, key in conn.execute(_SQL_LOCAL_PDFS, params):
+                pdf_keys.setdefault(item_id, key)
+
+            items = []
+            for item_id, key, item_type in conn.execute(_SQL_LOCAL_ITEMS, params):
+                data = fields.get(item_id, {})
+                items.append(ZoteroItem(
+                    key=key,
+                    title=data.get("title", "Untitled"),
+                    item_type=item_type,
+                    creators=creators.get(item_id, []),
+                    date=_LOCAL_DATE_PREFIX.sub("", data.get("date", "")),
+                    doi=data.get("DOI", ""),
+                    url=data.get("url", ""),
+                    abstract=data.get("abstractNote", ""),
+                    tags=tags.get(item_id, []),
+                    collections=collections.get(item_id, []),
+                    pdf_key=pdf_keys.get(item_id, ""),
+                ))
+
+            logger.info(
+                "Found %d items in collection %s (local database)",
+                len(items), collection_key,
+            )
+            return items
+        except sqlite3.Error as e:
+            logger.warning("Local Zotero database read failed, using the API: %s", e)
+            return None
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _pdf_key_from_links(item: Dict[str, Any]) -> Optional[str]:
+        """PDF attachment key from an item's API ``links.attachment``.
+
+        The API links each top-level item to its best file attachment, so
+        a collection listing already says which items have a PDF.  Returns
+        "" if the item has no file attachment, or None if the listing
+        doesn't say (no links, or a non-PDF best attachment) and the
+        item's children must be checked.
+        """
+        links = item.get("links")
+        if links is None:
+            return None
+        attachment = links.get("attachment")
+        if not attachment:
+            return ""
+        if attachment.get("attachmentType") != "application/pdf":
+            return None
+        return attachment.get("href", "").rstrip("/").rsplit("/", 1)[-1] or None
+
+    def _all_pdf_attachments(self, collection_key: str) -> Dict[str, str]:
+        """Parent item key → PDF attachment key for a whole collection.
+
+        One paginated ``itemType=attachment`` listing instead of a
+        children() call per item.  The API can't filter on contentType,
+        so that is checked here; the first PDF per parent wins.
+        """
+        raw = self._api(lambda: self.zot.everything(
+            self.zot.collection_items(collection_key, itemType="attachment",
+                                      limit=_PAGE_SIZE)
+        ))
+        pdf_keys: Dict[str, str] = {}
+        for att in raw:
+            data = att.get("data", att)
+            parent = data.get("parentItem")
+            if parent and data.get("contentType") == "application/pdf":
+                pdf_keys.setdefault(parent, data.get("key", ""))
+        return pdf_keys
+
+    def resolve_pdf_keys(self, collection_key: str, items: List[ZoteroItem]):
+        """Fill in ``pdf_key`` for items whose listing didn't say.
+
+        Usually every item is already resolved (see _pdf_key_from_links);
+        for two or more unknowns, one batched attachment listing beats a
+        children() lookup each.  On failure the items are left as they
+        were and get_item_pdf() checks their children as before.
+        """
+        unresolved = [item for item in items if item.pdf_key is None]
+        if len(unresolved) < 2:
+            return
+        try:
+            pdf_keys = self._all_pdf_attachments(collection_key)
+        except Exception as e:
+            logger.warning(
+                "Batched attachment lookup failed for %s: %s",
+                collection_key, e,
+            )
+            return
+        for item in unresolved:
+            item.pdf_key = pdf_keys.get(item.key, "")
+
+    def get_item_pdf(self, item_key: str, download_dir: Optional[str] = None,
+                     pdf_key: Optional[str] = None,
+                     title: str = "") -> Optional[str]:
         """
         Get the PDF for a library item.
 
         First tries local storage (fast), then falls back to API download.
         Returns the local file path to the PDF, or None if no PDF found.
+
+        Pass the item's ``pdf_key`` (from get_collection_items) to skip
+        the children() lookup, and its ``title`` to name the download
+        after it (the listing doesn't carry the attachment's filename;
+        NotebookLM titles uploaded sources by filename).
         """
         try:
-            # Get children (attachments) of this item
-            children = self.zot.children(item_key)
-
-            pdf_attachment = None
-            for child in children:
-                data = child.get("data", child)
-                content_type = data.get("contentType", "")
-                if content_type == "application/pdf":
-                    pdf_attachment = data
-                    break
-
-            if not pdf_attachment:
-                logger.debug(f"No PDF attachment found for item {item_key}")
+            if pdf_key == "":
+                logger.debug("No PDF attachment found for item %s", item_key)
                 return None
 
-            attachment_key = pdf_attachment.get("key", "")
-            filename = pdf_attachment.get("filename", f"{attachment_key}.pdf")
+            if pdf_key:
+                attachment_key = pdf_key
+                filename = f"{sanitize_filename(title)[:150].strip() or pdf_key}.pdf"
+            else:
+                # Get children (attachments) of this item
+                children = self._api(self.zot.children, item_key)
+
+                pdf_attachment = None
+                for child in children:
+                    data = child.get("data", child)
+                    content_type = data.get("contentType", "")
+                    if content_type == "application/pdf":
+                        pdf_attachment = data
+                        break
+
+                if not pdf_attachment:
+                    logger.debug("No PDF attachment found for item %s", item_key)
+                    return None
+
+                attachment_key = pdf_attachment.get("key", "")
+                filename = pdf_attachment.get("filename", f"{attachment_key}.pdf")
 
             # Strategy 1: Try local Zotero storage
             if self.local_storage_path:
@@ -172,46 +666,264 @@ class ZoteroClient:
                 if local_pdf:
                     return local_pdf
 
+            # An earlier run found the file missing or forbidden
+            if self._known_missing(attachment_key):
+                return None
+
             # Strategy 2: Download via API
             return self._download_pdf(attachment_key, filename, download_dir)
 
         except Exception as e:
-            logger.error(f"Failed to get PDF for item {item_key}: {e}")
+            logger.error("Failed to get PDF for item %s: %s", item_key, e)
             return None
 
+    def _build_local_attachment_index(self) -> Dict[str, str]:
+        """Map attachment key → PDF path for everything in local storage.
+
+        One pass over storage/{ATTACHMENT_KEY}/, so later lookups are a
+        dict hit instead of a directory listing per item.
+        """
+        index: Dict[str, str] = {}
+        try:
+            with os.scandir(self.local_storage_path) as storage:
+                for entry in storage:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        with os.scandir(entry.path) as files:
+                            for f in files:
+                                if (f.name.lower().endswith(".pdf")
+                                        and f.is_file(follow_symlinks=False)):
+                                    index[entry.name] = f.path
+                                    break
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(
+                "Could not index local storage %s: %s",
+                self.local_storage_path, e,
+            )
+        logger.info("Indexed %d local PDF attachments", len(index))
+        return index
+
+    def _local_index(self) -> Dict[str, str]:
+        """The local attachment index, built once per client."""
+        if self._local_attachment_index is None:
+            with self._local_index_lock:
+                if self._local_attachment_index is None:
+                    self._local_attachment_index = self._build_local_attachment_index()
+        return self._local_attachment_index
+
     def _find_local_pdf(self, attachment_key: str, filename: str) -> Optional[str]:
         """Look for PDF in Zotero's local storage directory."""
-        storage = Path(self.local_storage_path)
-        if not storage.exists():
-            return None
+        # Index hit: one stat to make sure the file hasn't gone away since
+        path = self._local_index().get(attachment_key)
+        if path and os.path.isfile(path):
+            logger.debug("Found local PDF: %s", path)
+            return path
 
+        # Miss — the attachment may have been synced after the index was built.
         # Zotero stores files as: storage/{ATTACHMENT_KEY}/{filename}
-        pdf_dir = storage / attachment_key
-        if pdf_dir.exists():
-            for f in pdf_dir.iterdir():
-                if f.suffix.lower() == ".pdf":
-                    logger.debug(f"Found local PDF: {f}")
-                    return str(f)
+        try:
+            with os.scandir(os.path.join(self.local_storage_path, attachment_key)) as it:
+                for entry in it:
+                    if (entry.name.lower().endswith(".pdf")
+                            and entry.is_file(follow_symlinks=False)):
+                        logger.debug("Found local PDF: %s", entry.path)
+                        self._local_attachment_index[attachment_key] = entry.path
+                        return entry.path
+        except OSError:  # no such attachment directory (or storage)
+            pass
         return None
 
     def _download_pdf(self, attachment_key: str, filename: str,
                       download_dir: Optional[str] = None) -> Optional[str]:
-        """Download PDF via Zotero API."""
+        """Download PDF via Zotero API.
+
+        The file is streamed to a temporary file in the target directory
+        (bounded memory) and only renamed into place once complete.  A
+        response that doesn't start with ``%PDF`` or exceeds max_pdf_bytes
+        is discarded.
+        """
+        tmp_path = None
         try:
             if not download_dir:
-                download_dir = tempfile.mkdtemp(prefix="citebridge_")
+                download_dir = self._session_download_dir()
+
+            url = (f"{ZOTERO_API_URL}/{self.library_type}s/{self.library_id}"
+                   f"/items/{attachment_key}/file")
+            headers = {"Zotero-API-Key": self.api_key, "Zotero-API-Version": "3"}
 
-            dest = Path(download_dir) / filename
-            # pyzotero's file() method returns the binary content
-            pdf_content = self.zot.file(attachment_key)
-            with open(dest, "wb") as f:
-                f.write(pdf_content)
+            for attempt in range(_API_ATTEMPTS):
+                with self._api_slots, self._http.stream(
+                    "GET", url, headers=headers,
+                    follow_redirects=True, timeout=60.0,
+                ) as resp:
+                    if resp.status_code == 429 and attempt < _API_ATTEMPTS - 1:
+                        delay = _header_delay(resp.headers.get("Retry-After"))
+                        if delay is None:
+                            delay = _DEFAULT_RETRY_AFTER
+                    else:
+                        resp.raise_for_status()
+                        fd, tmp_path = tempfile.mkstemp(
+                            dir=download_dir, suffix=".part"
+                        )
+                        with os.fdopen(fd, "wb") as f:
+                            if not self._write_pdf_stream(resp, f, attachment_key):
+                                return None
+                        break
+                logger.warning("Zotero rate limit hit; retrying in %.0fs", delay)
+                time.sleep(delay)
 
-            logger.info(f"Downloaded PDF to {dest}")
+            dest = self._reserve_dest(Path(download_dir), filename, attachment_key)
+            os.replace(tmp_path, dest)
+            tmp_path = None
+            logger.info("Downloaded PDF to %s", dest)
             return str(dest)
+        except httpx.HTTPStatusError as e:
+            # Missing or forbidden file: not worth retrying every run
+            if e.response.status_code in (403, 404, 410):
+                self._remember_missing(attachment_key)
+            logger.error("Failed to download PDF %s: %s", attachment_key, e)
+            return None
         except Exception as e:
-            logger.error(f"Failed to download PDF {attachment_key}: {e}")
+            logger.error("Failed to download PDF %s: %s", attachment_key, e)
             return None
+        finally:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _read_pdf_cache() -> Dict[str, float]:
+        """Unexpired, well-formed entries from PDF_CACHE_FILE."""
+        try:
+            with open(PDF_CACHE_FILE, "r") as f:
+                loaded = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(loaded, dict):
+            return {}
+        cutoff = time.time() - _PDF_NEGATIVE_TTL
+        return {
+            key: float(failed_at) for key, failed_at in loaded.items()
+            if isinstance(key, str) and isinstance(failed_at, (int, float))
+            and not isinstance(failed_at, bool) and failed_at > cutoff
+        }
+
+    def _pdf_cache_map(self) -> Dict[str, float]:
+        """The negative download cache, loaded on first use."""
+        if self._pdf_cache is None:
+            self._pdf_cache = self._read_pdf_cache()
+        return self._pdf_cache
+
+    def _pdf_cache_key(self, attachment_key: str) -> str:
+        return f"{self.library_type}:{self.library_id}/{attachment_key}"
+
+    def _known_missing(self, attachment_key: str) -> bool:
+        """Whether a recent download of this attachment got 403/404/410."""
+        with self._pdf_cache_lock:
+            failed_at = self._pdf_cache_map().get(self._pdf_cache_key(attachment_key))
+        if failed_at is not None and time.time() - failed_at < _PDF_NEGATIVE_TTL:
+            logger.debug("Skipping %s: file missing on an earlier run", attachment_key)
+            return True
+        return False
+
+    def _remember_missing(self, attachment_key: str):
+        """Record a definitive (403/404/410) download failure."""
+        with self._pdf_cache_lock:
+            self._pdf_cache_map()[self._pdf_cache_key(attachment_key)] = time.time()
+            self._pdf_cache_dirty += 1
+            flush = self._pdf_cache_dirty >= _PDF_CACHE_FLUSH_EVERY
+        if flush:
+            self.flush_pdf_cache()
+
+    def flush_pdf_cache(self):
+        """Merge pending download-cache entries into PDF_CACHE_FILE.
+
+        The file is re-read first, so entries written meanwhile by another
+        client (e.g. the GUI's and the sync engine's) are kept.
+        """
+        with self._pdf_cache_lock:
+            if not self._pdf_cache_dirty:
+                return
+            merged = self._read_pdf_cache()
+            for key, failed_at in self._pdf_cache_map().items():
+                merged[key] = max(failed_at, merged.get(key, 0.0))
+            tmp = None
+            try:
+                PDF_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=PDF_CACHE_FILE.parent, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    json.dump(merged, f)
+                os.replace(tmp, PDF_CACHE_FILE)
+                tmp = None
+                self._pdf_cache = merged
+                self._pdf_cache_dirty = 0
+            except OSError as e:
+                logger.debug("Could not write PDF cache: %s", e)
+            finally:
+                if tmp:
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
+
+    @staticmethod
+    def _reserve_dest(download_dir: Path, filename: str,
+                      attachment_key: str) -> Path:
+        """Claim a free file name in download_dir.
+
+        Concurrent downloads can share a name (items with the same title);
+        the later one gets the attachment key appended.
+        """
+        path = Path(filename)
+        for name in (filename, f"{path.stem} ({attachment_key}){path.suffix}"):
+            dest = download_dir / name
+            try:
+                os.close(os.open(dest, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return dest
+            except FileExistsError:
+                continue
+        return dest
+
+    def _session_download_dir(self) -> str:
+        """Temp directory for downloads made without a download_dir.
+
+        One per client, removed at interpreter exit.
+        """
+        if self._session_tmpdir is None:
+            with self._session_tmpdir_lock:
+                if self._session_tmpdir is None:
+                    path = tempfile.mkdtemp(prefix="citebridge_")
+                    atexit.register(shutil.rmtree, path, ignore_errors=True)
+                    self._session_tmpdir = path
+        return self._session_tmpdir
+
+    def _write_pdf_stream(self, resp, f, attachment_key: str) -> bool:
+        """Copy a streamed response into ``f``; False if it isn't a valid PDF."""
+        total = 0
+        head = b""
+        for chunk in resp.iter_bytes(_DOWNLOAD_CHUNK):
+            if len(head) < 4:
+                head += chunk[:4 - len(head)]
+                if len(head) >= 4 and not head.startswith(b"%PDF"):
+                    logger.error("Attachment %s is not a PDF", attachment_key)
+                    return False
+            total += len(chunk)
+            if total > self.max_pdf_bytes:
+                logger.error(
+                    "Attachment %s exceeds %dMB download limit",
+                    attachment_key, self.max_pdf_bytes // (1024 * 1024),
+                )
+                return False
+            f.write(chunk)
+        if not head.startswith(b"%PDF"):
+            logger.error("Attachment %s is not a PDF", attachment_key)
+            return False
+        return True
 
     def get_item_pdfs_for_collection(self, collection_key: str,
                                       download_dir: Optional[str] = None
@@ -221,19 +933,29 @@ class ZoteroClient:
         Returns list of dicts with item info and pdf_path.
         """
         items = self.get_collection_items(collection_key)
-        results = []
+        self.resolve_pdf_keys(collection_key, items)
 
-        for item in items:
-            pdf_path = self.get_item_pdf(item.key, download_dir)
-            results.append({
+        # Lookups/downloads run concurrently; map() keeps item order
+        pdf_paths = self._worker_pool().map(
+            lambda item: self.get_item_pdf(item.key, download_dir,
+                                           pdf_key=item.pdf_key,
+                                           title=item.title),
+            items,
+        )
+        results = [
+            {
                 "item": item,
                 "pdf_path": pdf_path,
                 "has_pdf": pdf_path is not None,
-            })
+            }
+            for item, pdf_path in zip(items, pdf_paths)
+        ]
+        self.flush_pdf_cache()
 
         with_pdf = sum(1 for r in results if r["has_pdf"])
         logger.info(
-            f"Collection {collection_key}: {with_pdf}/{len(results)} items have PDFs"
+            "Collection %s: %d/%d items have PDFs",
+            collection_key, with_pdf, len(results),
         )
         return results
 
@@ -246,7 +968,7 @@ class ZoteroClient:
         Returns the key of the created note, or None on failure.
         """
         try:
-            note_template = self.zot.item_template("note")
+            note_template = copy.deepcopy(self._item_template("note"))
             note_template["note"] = f"<h2>{title}</h2>\n{content}"
             note_template["tags"] = [{"tag": t} for t in (tags or ["notebooklm-sync"])]
 
@@ -255,11 +977,11 @@ class ZoteroClient:
                 created = result["successful"]
                 if created:
                     key = list(created.values())[0].get("data", {}).get("key", "")
-                    logger.info(f"Created note {key} under item {parent_item_key}")
+                    logger.info("Created note %s under item %s", key, parent_item_key)
                     return key
             return None
         except Exception as e:
-            logger.error(f"Failed to create note for item {parent_item_key}: {e}")
+            logger.error("Failed to create note for item %s: %s", parent_item_key, e)
             return None
 
     # ── Source Import (NotebookLM → Zotero) ──
@@ -280,26 +1002,30 @@ class ZoteroClient:
                 created = result["successful"]
                 if created:
                     key = list(created.values())[0].get("data", {}).get("key", "")
-                    logger.info(f"Created collection '{name}' ({key})")
+                    logger.info("Created collection '%s' (%s)", name, key)
+                    cached = self._collections_cache
+                    if cached is not None:
+                        cached[1].append(ZoteroCollection(
+                            key=key, name=name, parent_key=parent_key,
+                        ))
+                        cached[2].setdefault(name, key)
                     return key
             return None
         except Exception as e:
-            logger.error(f"Failed to create collection '{name}': {e}")
+            logger.error("Failed to create collection '%s': %s", name, e)
             return None
 
     def find_collection_by_name(self, name: str) -> Optional[str]:
         """Find a collection by name. Returns key or None."""
-        collections = self.get_collections()
-        for c in collections:
-            if c.name == name:
-                return c.key
-        return None
+        self.get_collections()  # refreshes the cache if stale
+        cached = self._collections_cache
+        return cached[2].get(name) if cached else None
 
     def find_or_create_collection(self, name: str) -> Optional[str]:
         """Find existing collection by name, or create a new one."""
         key = self.find_collection_by_name(name)
         if key:
-            logger.info(f"Found existing collection: {name}")
+            logger.info("Found existing collection: %s", name)
             return key
         return self.create_collection(name)
 
@@ -327,97 +1053,142 @@ class ZoteroClient:
         Returns:
             The Zotero item key, or None on failure.
         """
-        try:
-            # Map NLM source types to Zotero item types
-            zotero_type = self._nlm_type_to_zotero_type(source_type)
-            template = self.zot.item_template(zotero_type)
-
-            # Set common fields
-            template["title"] = title
-            template["tags"] = [
-                {"tag": t} for t in (tags or ["notebooklm-import", "nlm-source"])
-            ]
-            if collection_key:
-                template["collections"] = [collection_key]
-
-            # Set type-specific fields
-            if url:
-                template["url"] = url
-
-            if zotero_type == "webpage":
-                template["websiteTitle"] = "NotebookLM Source"
-                if url:
-                    template["url"] = url
-            elif zotero_type == "videoRecording":
-                template["videoRecordingFormat"] = "YouTube"
-                if url:
-                    template["url"] = url
-            elif zotero_type == "document":
-                template["publisher"] = "NotebookLM Import"
-            elif zotero_type == "journalArticle":
-                # For PDFs, try to extract basic metadata from title
-                pass
-
-            # Create the item
-            result = self.zot.create_items([template])
-            if not result or "successful" not in result:
-                logger.error(f"Failed to create item for '{title}'")
-                return None
+        return self.import_sources_as_items([{
+            "source_type": source_type, "title": title, "url": url,
+            "fulltext": fulltext, "collection_key": collection_key, "tags": tags,
+        }])[0]
 
-            created = result["successful"]
-            if not created:
-                return None
+    def import_sources_as_items(self, sources: List[Dict[str, Any]]
+                                ) -> List[Optional[str]]:
+        """
+        Batch form of import_source_as_item().
 
-            item_key = list(created.values())[0].get("data", {}).get("key", "")
-            logger.info(f"Created Zotero item: {title} ({item_key}) [{zotero_type}]")
+        ``sources`` holds that method's keyword arguments, one dict per
+        source.  Items are created _WRITE_BATCH per request, then their
+        fulltext notes in a second pass once the parent keys are known.
+
+        Returns the created item key (or None) for each source, in order.
+        """
+        keys: List[Optional[str]] = [None] * len(sources)
+        payloads = []
+        for i, src in enumerate(sources):
+            try:
+                payloads.append((i, self._import_payload(**{
+                    k: v for k, v in src.items() if k != "fulltext"
+                })))
+            except Exception as e:
+                logger.error("Failed to import source '%s': %s", src.get("title"), e)
 
+        created = self._create_many([payload for _, payload in payloads])
+        notes = []
+        note_sources = []
+        for (i, payload), item_key in zip(payloads, created):
+            src = sources[i]
+            if not item_key:
+                logger.error("Failed to create item for '%s'", src.get("title"))
+                continue
+            keys[i] = item_key
+            logger.info(
+                "Created Zotero item: %s (%s) [%s]",
+                src.get("title"), item_key, payload.get("itemType", ""),
+            )
             # Attach the fulltext as a child note (this is the real value)
+            fulltext = src.get("fulltext") or ""
             if fulltext:
-                # Truncate very long content for Zotero note (limit ~1MB)
-                max_chars = 500_000
-                text = fulltext[:max_chars]
-                if len(fulltext) > max_chars:
-                    text += f"\n\n[...truncated, {len(fulltext):,} chars total]"
-
-                self.create_note(
-                    item_key,
-                    title=f"Full Text (from NotebookLM)",
-                    content=f"<pre>{self._escape_html(text)}</pre>",
-                    tags=["nlm-fulltext"],
+                try:
+                    note = copy.deepcopy(self._item_template("note"))
+                except Exception as e:
+                    logger.error("Failed to create note for item %s: %s", item_key, e)
+                    continue
+                note["note"] = (
+                    f"<h2>Full Text (from NotebookLM)</h2>\n"
+                    f"{self._fulltext_note_content(fulltext)}"
                 )
-                logger.info(f"  Attached fulltext ({len(fulltext):,} chars) to {item_key}")
+                note["tags"] = [{"tag": "nlm-fulltext"}]
+                note["parentItem"] = item_key
+                notes.append(note)
+                note_sources.append((item_key, len(fulltext)))
 
-            return item_key
+        for (item_key, length), note_key in zip(note_sources, self._create_many(notes)):
+            if note_key:
+                logger.info(
+                    "  Attached fulltext (%d chars) to %s", length, item_key,
+                )
+            else:
+                logger.error("Failed to create note for item %s", item_key)
+        return keys
 
-        except Exception as e:
-            logger.error(f"Failed to import source '{title}': {e}")
-            return None
+    def _import_payload(self, source_type: str, title: str,
+                        url: Optional[str] = None,
+                        collection_key: Optional[str] = None,
+                        tags: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Item template for a NotebookLM source (see import_source_as_item)."""
+        # Map NLM source types to Zotero item types
+        zotero_type = self._nlm_type_to_zotero_type(source_type)
+        template = copy.deepcopy(self._item_template(zotero_type))
+
+        # Set common fields
+        template["title"] = title
+        template["tags"] = [
+            {"tag": t} for t in (tags or ["notebooklm-import", "nlm-source"])
+        ]
+        if collection_key:
+            template["collections"] = [collection_key]
+
+        # Set type-specific fields
+        if url:
+            template["url"] = url
+        type_fields = _IMPORT_TYPE_FIELDS.get(zotero_type)
+        if type_fields:
+            template.update(type_fields)
+        return template
+
+    @classmethod
+    def _fulltext_note_content(cls, fulltext: str) -> str:
+        """Escaped <pre> block for a fulltext note."""
+        # Truncate very long content for Zotero note (limit ~1MB)
+        max_chars = 500_000
+        parts = ["<pre>", cls._escape_html(fulltext[:max_chars])]
+        if len(fulltext) > max_chars:
+            parts.append(f"\n\n[...truncated, {len(fulltext):,} chars total]")
+        parts.append("</pre>")
+        return "".join(parts)
+
+    def _create_many(self, payloads: List[Dict[str, Any]]) -> List[str]:
+        """create_items() in write batches; the new key per payload ("" if not created).
+
+        A batch holds at most _WRITE_BATCH objects (the API's limit) and,
+        past the first object, at most _WRITE_BATCH_CHARS of note text.
+        """
+        keys: List[str] = []
+        batch: List[Dict[str, Any]] = []
+        size = 0
+        for payload in payloads + [None]:
+            note_len = len(payload.get("note", "")) if payload is not None else 0
+            if batch and (payload is None or len(batch) >= _WRITE_BATCH
+                          or size + note_len > _WRITE_BATCH_CHARS):
+                try:
+                    result = self._api(self.zot.create_items, batch) or {}
+                except Exception as e:
+                    logger.error("Failed to create %d Zotero items: %s", len(batch), e)
+                    result = {}
+                created = result.get("successful") or {}
+                for i in range(len(batch)):
+                    keys.append(created.get(str(i), {}).get("data", {}).get("key", ""))
+                for i, failure in (result.get("failed") or {}).items():
+                    logger.error("Zotero rejected item %s of batch: %s", i, failure)
+                batch, size = [], 0
+            if payload is not None:
+                batch.append(payload)
+                size += note_len
+        return keys
 
     @staticmethod
     def _nlm_type_to_zotero_type(source_type: str) -> str:
         """Map NotebookLM source types to Zotero item types."""
-        mapping = {
-            "web_page": "webpage",
-            "pdf": "journalArticle",
-            "youtube": "videoRecording",
-            "google_docs": "document",
-            "google_slides": "presentation",
-            "google_spreadsheet": "document",
-            "google_drive_audio": "audioRecording",
-            "google_drive_video": "videoRecording",
-            "csv": "document",
-            "docx": "document",
-            "markdown": "document",
-            "pasted_text": "document",
-            "image": "artwork",
-        }
-        return mapping.get(source_type, "document")
+        return _NLM_TO_ZOTERO.get(source_type, "document")
 
     @staticmethod
     def _escape_html(text: str) -> str:
         """Escape HTML special characters for Zotero note content."""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
+        return html.escape(text, quote=False)